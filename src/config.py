@@ -5,12 +5,158 @@ of the application. The configuration settings are stored in a 'config.yaml' fil
 
 import os
 import sys
+import functools
+import io
 import logging
-from ruamel.yaml import YAML
-from ruamel.yaml.comments import CommentedMap
+import numbers
+import json
+import yaml
 
+try:
+    # libyaml based loader - much faster than the pure python implementation
+    from yaml import CSafeLoader as YamlLoader
+
+    LIBYAML_AVAILABLE = True
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+    LIBYAML_AVAILABLE = False
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+
+# all modules log via the "__main__" logger, which gets its handlers and level in
+# eos_connect - a per module logger would lose the messages.
+# No import time message here: this module is imported before the handlers are set
+# up, so it would never be shown anyway.
 logger = logging.getLogger("__main__")
-logger.info("[Config] loading module ")
+
+
+@functools.cache
+def _default_config():
+    """
+    Returns the default configuration - built on first use only, since a normal start
+    with an existing config.yaml does not need it.
+    """
+    from config_defaults import (  # pylint: disable=import-outside-toplevel
+        build_default_config,
+    )
+
+    return build_default_config()
+
+
+# top level keys of the default configuration
+_DEFAULT_KEYS = frozenset(
+    (
+        "load",
+        "eos",
+        "price",
+        "battery",
+        "pv_forecast_source",
+        "pv_forecast",
+        "inverter",
+        "evcc",
+        "mqtt",
+        "refresh_time",
+        "time_zone",
+        "eos_connect_web_port",
+        "log_level",
+    )
+)
+
+_NUMBER = numbers.Real
+
+# (dotted path, expected type) of the settings the application can not work without
+_SCHEMA_REQUIRED = (
+    ("eos.server", str),
+    ("eos.port", int),
+    ("eos.timeout", _NUMBER),
+    ("battery.capacity_wh", _NUMBER),
+    ("battery.charge_efficiency", _NUMBER),
+    ("battery.discharge_efficiency", _NUMBER),
+    ("battery.max_charge_power_w", _NUMBER),
+    ("battery.min_soc_percentage", _NUMBER),
+    ("battery.max_soc_percentage", _NUMBER),
+    ("inverter.type", str),
+    ("inverter.max_grid_charge_rate", _NUMBER),
+    ("inverter.max_pv_charge_rate", _NUMBER),
+    ("refresh_time", _NUMBER),
+    ("time_zone", str),
+    ("eos_connect_web_port", int),
+    ("log_level", str),
+)
+
+# (dotted path, min, max) value ranges of required numeric settings
+_SCHEMA_RANGES = (
+    ("eos.port", 1, 65535),
+    ("eos.timeout", 1, None),
+    ("battery.capacity_wh", 0, None),
+    ("battery.charge_efficiency", 0, 1),
+    ("battery.discharge_efficiency", 0, 1),
+    ("battery.max_charge_power_w", 0, None),
+    ("battery.min_soc_percentage", 0, 100),
+    ("battery.max_soc_percentage", 0, 100),
+    ("inverter.max_grid_charge_rate", 0, None),
+    ("inverter.max_pv_charge_rate", 0, None),
+    ("refresh_time", 1, None),
+    ("eos_connect_web_port", 1, 65535),
+)
+
+_MISSING = object()
+
+
+def _get_path(config, path, default=None):
+    """
+    Returns the value addressed by a dotted path in a nested config dict.
+    """
+    value = config
+    for key in path.split("."):
+        try:
+            value = value[key]
+        except (KeyError, IndexError, TypeError):
+            return default
+    return value
+
+
+def _plain(value):
+    """
+    Returns a copy of the given (commented) config tree built from plain dicts and lists,
+    which are faster to access than the ruamel types.
+    """
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+def _intern_keys(value):
+    """
+    Returns the parsed config with all dict keys interned, so lookups with the string
+    literals used throughout the code base hit the identity fast path of dict lookups.
+    """
+    if isinstance(value, dict):
+        return {
+            sys.intern(key) if isinstance(key, str) else key: _intern_keys(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_intern_keys(item) for item in value]
+    return value
+
+
+class ConfigError(RuntimeError):
+    """
+    Raised if the configuration is invalid.
+    """
+
+
+class ConfigCreatedError(ConfigError):
+    """
+    Raised after a new 'config.yaml' with default values was created - the user has to
+    adjust it before the application can run.
+    """
 
 
 class ConfigManager:
@@ -22,375 +168,30 @@ class ConfigManager:
     prompts the user to restart the server.
     """
 
+    __slots__ = (
+        "current_dir",
+        "config_file",
+        "_cache_path",
+        "_mtime",
+        "config",
+        "_flat",
+    )
+
     def __init__(self, given_dir):
         self.current_dir = given_dir
         self.config_file = os.path.join(self.current_dir, "config.yaml")
-        self.yaml = YAML()
-        self.yaml.default_flow_style = False
-        self.yaml.indent(mapping=2, sequence=4, offset=2)
-        self.yaml.preserve_quotes = True
-        self.default_config = self.create_default_config()
-        self.config = self.default_config.copy()
+        self._cache_path = self.config_file + ".cache.json"
+        self._mtime = None  # (mtime_ns, size) of the currently loaded config.yaml
+        self.config = {}
+        self._flat = {}  # validated values of frequently used nested settings
         self.load_config()
 
-    def create_default_config(self):
+    @property
+    def default_config(self):
         """
-        Creates the default configuration with comments.
+        The default configuration (shared, treat as read only).
         """
-        config = CommentedMap(
-            {
-                "load": CommentedMap(
-                    {
-                        "source": "default",  # data source for load power
-                        "url": "http://homeassistant:8123",  # URL for openhab or homeassistant
-                        "access_token": "abc123",  # access token for homeassistant
-                        "load_sensor": "Load_Power",  # item / entity for load power data
-                        "car_charge_load_sensor": "Wallbox_Power",  # item / entity wallbox power
-                        # item / entity for additional load power data
-                        "additional_load_1_sensor": "additional_load_1_sensor",
-                        "additional_load_1_runtime": 0,  # runtime for additional load 1 in minutes
-                        "additional_load_1_consumption": 0,  # consumption for
-                        # additional load 1 in Wh
-                    }
-                ),
-                "eos": CommentedMap(
-                    {
-                        "server": "192.168.100.100",  # Default EOS server address
-                        "port": 8503,  # Default port for EOS server
-                        "timeout": 180,  # Default timeout for EOS optimize request
-                    }
-                ),
-                "price": CommentedMap(
-                    {
-                        "source": "default",
-                        "token": "tibberBearerToken",  # token for electricity price
-                        # 24 hours array with fixed end customer prices in ct/kWh over the day
-                        "fixed_24h_array": "10.1,10.1,10.1,10.1,10.1,23,28.23,28.23"
-                        + ",28.23,28.23,28.23,23.52,23.52,23.52,23.52,28.17,28.17,34.28,"
-                        + "34.28,34.28,34.28,34.28,28,23",
-                        "feed_in_price": 0.0,  # feed in price for the grid
-                        "negative_price_switch": False,  # switch for negative price
-                    }
-                ),
-                "battery": CommentedMap(
-                    {
-                        "source": "default",  # data source for battery soc
-                        "url": "http://homeassistant:8123",  # URL for openhab or homeassistant
-                        "soc_sensor": "battery_SOC",  # item / entity for battery SOC data
-                        "access_token": "abc123",  # access token for homeassistant
-                        "capacity_wh": 11059,
-                        "charge_efficiency": 0.88,
-                        "discharge_efficiency": 0.88,
-                        "max_charge_power_w": 5000,
-                        "min_soc_percentage": 5,
-                        "max_soc_percentage": 100,
-                        "price_euro_per_wh_accu": 0.0,  # price for battery in euro/Wh
-                        "charging_curve_enabled": True,  # enable charging curve
-                    }
-                ),
-                "pv_forecast_source": CommentedMap(
-                    {
-                        # openmeteo, openmeteo_local, forecast_solar, akkudoktor
-                        "source": "akkudoktor",
-                    }
-                ),
-                "pv_forecast": [
-                    CommentedMap(
-                        {
-                            "name": "myPvInstallation1",  # Placeholder for user-defined
-                            # configuration name
-                            "lat": 47.5,  # Latitude for PV forecast
-                            "lon": 8.5,  # Longitude for PV forecast
-                            "azimuth": 90.0,  # Azimuth for PV forecast
-                            "tilt": 30.0,  # Tilt for PV forecast
-                            "power": 4600,  # Power of PV system in Wp
-                            "powerInverter": 5000,  # Inverter Power
-                            "inverterEfficiency": 0.9,  # Inverter Efficiency for PV forecast
-                            "horizon": "10,20,10,15",  # Horizon to calculate shading
-                        }
-                    )
-                ],
-                "inverter": CommentedMap(
-                    {
-                        "type": "default",
-                        "address": "192.168.1.12",
-                        "user": "customer",
-                        "password": "abc123",
-                        "max_grid_charge_rate": 5000,
-                        "max_pv_charge_rate": 5000,
-                    }
-                ),
-                "evcc": CommentedMap(
-                    {
-                        # URL to your evcc installation, if not used set to ""
-                        # or leave as http://yourEVCCserver:7070
-                        "url": "http://yourEVCCserver:7070",
-                    }
-                ),
-                "mqtt": CommentedMap(
-                    {
-                        "enabled": False,  # Enable MQTT - default: false
-                        # URL for MQTT server - default: mqtt://yourMQTTserver
-                        "broker": "homeassistant",
-                        "port": 1883,  # Port for MQTT server - default: 1883
-                        "user": "username",  # Username for MQTT server - default: mqtt
-                        "password": "password",  # Password for MQTT server - default: mqtt
-                        "tls": False,  # Use TLS for MQTT server - default: false
-                        # Enable Home Assistant MQTT auto discovery - default: true
-                        "ha_mqtt_auto_discovery": True,
-                        # Prefix for Home Assistant MQTT auto discovery - default: homeassistant
-                        "ha_mqtt_auto_discovery_prefix": "homeassistant",
-                    }
-                ),
-                "refresh_time": 3,  # Default refresh time in minutes
-                "time_zone": "Europe/Berlin",  # Add default time zone
-                "eos_connect_web_port": 8081,  # Default port for EOS connect server
-                "log_level": "info",  # Default log level
-            }
-        )
-        # load configuration
-        config.yaml_set_comment_before_after_key("load", before="Load configuration")
-        config["load"].yaml_add_eol_comment(
-            "Data source for load power - openhab, homeassistant,"
-            + " default (using a static load profile)",
-            "source",
-        )
-        config["load"].yaml_add_eol_comment(
-            "access token for homeassistant (optional)", "access_token"
-        )
-        config["load"].yaml_add_eol_comment(
-            "URL for openhab or homeassistant"
-            + " (e.g. http://openhab:8080 or http://homeassistant:8123)",
-            "url",
-        )
-        config["load"].yaml_add_eol_comment(
-            "item / entity for load power data in watts", "load_sensor"
-        )
-        config["load"].yaml_add_eol_comment(
-            "item / entity for wallbox power data in watts. "
-            + '(If not needed, set to `load.car_charge_load_sensor: ""`)',
-            "car_charge_load_sensor",
-        )
-        config["load"].yaml_add_eol_comment(
-            "item / entity for additional load power data in watts."
-            + ' (If not needed set to `additional_load_1_sensor: ""`)',
-            "additional_load_1_sensor",
-        )
-        config["load"].yaml_add_eol_comment(
-            "runtime for additional load 1 in minutes - default: 0"
-            + ' (If not needed set to `additional_load_1_sensor: ""`)',
-            "additional_load_1_runtime",
-        )
-        config["load"].yaml_add_eol_comment(
-            "consumption for additional load 1 in Wh - default: 0"
-            + ' (If not needed set to `additional_load_1_sensor: ""`)',
-            "additional_load_1_consumption",
-        )
-
-        # eos configuration
-        config.yaml_set_comment_before_after_key(
-            "eos", before="EOS server configuration"
-        )
-        config["eos"].yaml_add_eol_comment("EOS server address", "server")
-        config["eos"].yaml_add_eol_comment(
-            "port for EOS server - default: 8503", "port"
-        )
-        config["eos"].yaml_add_eol_comment(
-            "timeout for EOS optimize request in seconds - default: 180", "timeout"
-        )
-        # price configuration
-        config.yaml_set_comment_before_after_key(
-            "price", before="Electricity price configuration"
-        )
-        config["price"].yaml_add_eol_comment(
-            "data source for electricity price tibber, smartenergy_at,"
-            + " fixed_24h, default (default uses akkudoktor)",
-            "source",
-        )
-        config["price"].yaml_add_eol_comment("Token for electricity price", "token")
-        config["price"].yaml_add_eol_comment(
-            "24 hours array with fixed end customer prices in ct/kWh over the day",
-            "fixed_24h_array",
-        )
-        config["price"].yaml_add_eol_comment(
-            "feed in price for the grid in €/kWh", "feed_in_price"
-        )
-        config["price"].yaml_add_eol_comment(
-            "switch for no payment if negative stock price is given",
-            "negative_price_switch",
-        )
-        # battery configuration
-        config.yaml_set_comment_before_after_key(
-            "battery", before="battery configuration"
-        )
-        config["battery"].yaml_add_eol_comment(
-            "Data source for battery soc - openhab, homeassistant, default", "source"
-        )
-        config["battery"].yaml_add_eol_comment(
-            "URL for openhab or homeassistant"
-            + " (e.g. http://openhab:8080 or http://homeassistant:8123)",
-            "url",
-        )
-        config["battery"].yaml_add_eol_comment(
-            "item / entity for battery SOC data in [0..1]", "soc_sensor"
-        )
-        config["battery"].yaml_add_eol_comment(
-            "access token for homeassistant (optional)", "access_token"
-        )
-        config["battery"].yaml_add_eol_comment("battery capacity in Wh", "capacity_wh")
-        config["battery"].yaml_add_eol_comment(
-            "efficiency for charging the battery in [0..1]", "charge_efficiency"
-        )
-        config["battery"].yaml_add_eol_comment(
-            "efficiency for discharging the battery in [0..1]", "discharge_efficiency"
-        )
-        config["battery"].yaml_add_eol_comment(
-            "max charging power in W", "max_charge_power_w"
-        )
-        config["battery"].yaml_add_eol_comment(
-            "URL for battery soc in %", "min_soc_percentage"
-        )
-        config["battery"].yaml_add_eol_comment(
-            "URL for battery soc in %", "max_soc_percentage"
-        )
-        config["battery"].yaml_add_eol_comment(
-            "price for battery in euro/Wh - default: 0.0", "price_euro_per_wh_accu"
-        )
-        config["battery"].yaml_add_eol_comment(
-            "enabling charging curve for controlled charging power"+
-            " according to the SOC (default: true)",
-            "charging_curve_enabled",
-        )
-
-        # pv forecast source configuration
-        config.yaml_set_comment_before_after_key(
-            "pv_forecast_source", before="pv forecast source configuration"
-        )
-        config["pv_forecast_source"].yaml_add_eol_comment(
-            "data source for solar forecast providers akkudoktor, openmeteo, openmeteo_local,"
-            + " forecast_solar, evcc, default (default uses akkudoktor)",
-            "source",
-        )
-        # pv forecast configuration
-        config.yaml_set_comment_before_after_key(
-            "pv_forecast",
-            before="List of PV forecast configurations."
-            + " Add multiple entries as needed.\nSee Akkudoktor API "
-            + "(https://api.akkudoktor.net/#/pv%20generation%20calculation/getForecast) "
-            + "for more details.",
-        )
-        for index, pv_config in enumerate(config["pv_forecast"]):
-            config["pv_forecast"][index].yaml_add_eol_comment(
-                "User-defined identifier for the PV installation,"
-                + " have to be unique if you use more installations",
-                "name",
-            )
-            config["pv_forecast"][index].yaml_add_eol_comment(
-                "Latitude for PV forecast", "lat"
-            )
-            config["pv_forecast"][index].yaml_add_eol_comment(
-                "Longitude for PV forecast", "lon"
-            )
-            config["pv_forecast"][index].yaml_add_eol_comment(
-                "Azimuth for PV forecast", "azimuth"
-            )
-            config["pv_forecast"][index].yaml_add_eol_comment(
-                "Tilt for PV forecast", "tilt"
-            )
-            config["pv_forecast"][index].yaml_add_eol_comment(
-                "Power for PV forecast", "power"
-            )
-            config["pv_forecast"][index].yaml_add_eol_comment(
-                "Power Inverter for PV forecast", "powerInverter"
-            )
-            config["pv_forecast"][index].yaml_add_eol_comment(
-                "Inverter Efficiency for PV forecast",
-                "inverterEfficiency",
-            )
-            config["pv_forecast"][index].yaml_add_eol_comment(
-                "Horizon to calculate shading, up to 360 values"
-                + " to describe the shading situation for your PV.",
-                "horizon",
-            )
-        # inverter configuration
-        config.yaml_set_comment_before_after_key(
-            "inverter", before="Inverter configuration"
-        )
-        config["inverter"].yaml_add_eol_comment(
-            "Type of inverter - fronius_gen24, fronius_gen24_legacy, evcc, default"
-            + " (default will disable inverter control -"
-            + " only displaying the target state) - preset: default",
-            "type",
-        )
-        config["inverter"].yaml_add_eol_comment(
-            "Address of the inverter (fronius_gen24/fronius_gen24_legacy only)", "address"
-        )
-        config["inverter"].yaml_add_eol_comment(
-            "Username for the inverter (fronius_gen24/fronius_gen24_legacy only)", "user"
-        )
-        config["inverter"].yaml_add_eol_comment(
-            "Password for the inverter (fronius_gen24/fronius_gen24_legacy only)", "password"
-        )
-        config["inverter"].yaml_add_eol_comment(
-            "Max inverter grid charge rate in W - default: 5000", "max_grid_charge_rate"
-        )
-        config["inverter"].yaml_add_eol_comment(
-            "Max inverter PV charge rate in W - default: 5000", "max_pv_charge_rate"
-        )
-        # evcc configuration
-        config.yaml_set_comment_before_after_key("evcc", before="EVCC configuration")
-        config["evcc"].yaml_add_eol_comment(
-            '# URL to your evcc installation, if not used set to ""'
-            + " or leave as http://yourEVCCserver:7070",
-            "url",
-        )
-        # mqtt configuration
-        config.yaml_set_comment_before_after_key("mqtt", before="MQTT configuration")
-        config["mqtt"].yaml_add_eol_comment("Enable MQTT - default: false", "enabled")
-        config["mqtt"].yaml_add_eol_comment(
-            "URL for MQTT server - default: mqtt://yourMQTTserver", "broker"
-        )
-        config["mqtt"].yaml_add_eol_comment(
-            "Port for MQTT server - default: 1883", "port"
-        )
-        config["mqtt"].yaml_add_eol_comment(
-            "Username for MQTT server - default: mqtt", "user"
-        )
-        config["mqtt"].yaml_add_eol_comment(
-            "Password for MQTT server - default: mqtt", "password"
-        )
-        config["mqtt"].yaml_add_eol_comment(
-            "Use TLS for MQTT server - default: false", "tls"
-        )
-        config["mqtt"].yaml_add_eol_comment(
-            "Enable Home Assistant MQTT auto discovery - default: true",
-            "ha_mqtt_auto_discovery",
-        )
-        config["mqtt"].yaml_add_eol_comment(
-            "Prefix for Home Assistant MQTT auto discovery - default: homeassistant",
-            "ha_mqtt_auto_discovery_prefix",
-        )
-
-        # refresh time configuration
-        config.yaml_add_eol_comment(
-            "Default refresh time of EOS connect in minutes - default: 3",
-            "refresh_time",
-        )
-        # time zone configuration
-        config.yaml_add_eol_comment(
-            "Default time zone - default: Europe/Berlin", "time_zone"
-        )
-        # eos connect web port configuration
-        config.yaml_add_eol_comment(
-            "Default port for EOS connect server - default: 8081",
-            "eos_connect_web_port",
-        )
-        # loglevel configuration
-        config.yaml_add_eol_comment(
-            "Log level for the application : debug, info, warning, error - default: info",
-            "log_level",
-        )
-        return config
+        return _default_config()
 
     def load_config(self):
         """
@@ -398,33 +199,210 @@ class ConfigManager:
         If the file exists, it loads the configuration values.
         If the file does not exist, it creates a new 'config.yaml' file with default values and
         prompts the user to restart the server after configuring the settings.
+
+        The parsed content is cached in a json file next to 'config.yaml' keyed by
+        modification time and size of the yaml file - as long as the yaml file is unchanged
+        the (slow) yaml parsing is skipped.
         """
-        if os.path.exists(self.config_file):
-            with open(self.config_file, "r", encoding="utf-8") as f:
-                self.config.update(self.yaml.load(f))
-            self.check_eos_timeout_and_refreshtime()
-        else:
+        try:
+            config_file_handle = open(self.config_file, "rb")
+        except FileNotFoundError:
+            # the defaults are only written out before exiting - no need for a copy
+            self.config = self.default_config
             self.write_config()
             print("Config file not found. Created a new one with default values.")
             print(
                 "Please restart the server after configuring the settings in config.yaml"
             )
-            sys.exit(0)
+            raise ConfigCreatedError(
+                f"Created default config file {self.config_file}"
+            ) from None
+
+        with config_file_handle:
+            stat = os.fstat(config_file_handle.fileno())
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if signature == self._mtime:
+                return  # already loaded and unchanged
+            parsed = self.__read_cache(signature)
+            if parsed is None:
+                # the commented ruamel tree is only needed for writing the default file,
+                # reading is done with the (much faster) libyaml based loader - it gets
+                # the raw bytes in one contiguous buffer and does the decoding itself
+                if not LIBYAML_AVAILABLE:
+                    logger.warning(
+                        "[Config] PyYAML without libyaml support - parsing config.yaml"
+                        " with the slow pure python loader"
+                    )
+                data = config_file_handle.read()
+                # an empty (or comment only) file yields None
+                parsed = yaml.load(data, Loader=YamlLoader) or {}
+                self.__write_cache(signature, parsed)
+        parsed = _intern_keys(parsed)
+        if not parsed.keys() >= _DEFAULT_KEYS:
+            # older config files may lack newer sections - fill only those with defaults
+            for key in _DEFAULT_KEYS - parsed.keys():
+                parsed[key] = _plain(self.default_config[key])
+        self.config = parsed
+        self._mtime = signature
+        self.validate()
+        self._flat = {
+            "eos.timeout": self.config["eos"]["timeout"],
+            "refresh_time": self.config["refresh_time"],
+        }
+        self.check_eos_timeout_and_refreshtime()
+
+    def __read_cache(self, signature):
+        """
+        Returns the cached parsed config if the cache matches the given signature of
+        'config.yaml', otherwise None.
+        """
+        try:
+            with open(self._cache_path, "rb") as cache_file:
+                cached = json.loads(cache_file.read())
+            cached_signature = (cached["mtime_ns"], cached["size"])
+            parsed = cached["config"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug("[Config] ignoring unreadable config cache: %s", e)
+            return None
+        if cached_signature != signature or not isinstance(parsed, dict):
+            return None
+        logger.debug("[Config] using cached config from %s", self._cache_path)
+        return parsed
+
+    def __write_cache(self, signature, parsed):
+        """
+        Stores the parsed config together with the signature of 'config.yaml'.
+        The cache is written to a temporary file first and then moved into place, so a
+        concurrent reader never sees a partially written cache.
+        JSON is used instead of pickle, so a tampered cache file can not execute code -
+        configs with values JSON can not represent unchanged (e.g. yaml dates) are not
+        cached.
+        """
+        try:
+            cache_content = json.dumps(
+                {"mtime_ns": signature[0], "size": signature[1], "config": parsed}
+            )
+        except (TypeError, ValueError):
+            cache_content = None
+        if cache_content is None or json.loads(cache_content)["config"] != parsed:
+            logger.debug("[Config] config can not be cached as json - skipping cache")
+            return
+        tmp_path = f"{self._cache_path}.{os.getpid()}.tmp"
+        try:
+            # the cache holds the secrets of config.yaml - only the owner may read it
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+                cache_file.write(cache_content)
+            os.replace(tmp_path, self._cache_path)
+        except OSError as e:
+            # e.g. read only config directory - caching is optional
+            logger.debug("[Config] could not write config cache: %s", e)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def get(self, path, default=None):
+        """
+        Returns a config value addressed by a dotted path, e.g. get("eos.timeout").
+        """
+        if path in self._flat:
+            return self._flat[path]
+        return _get_path(self.config, path, default)
 
     def write_config(self):
         """
         Writes the configuration to 'config.yaml' file located in the current directory.
         """
         logger.info("[Config] writing config file")
-        with open(self.config_file, "w", encoding="utf-8") as config_file_handle:
-            self.yaml.dump(self.config, config_file_handle)
+        # ruamel.yaml is imported here only - it is not needed for reading the config
+        from ruamel.yaml import YAML  # pylint: disable=import-outside-toplevel
+        from ruamel.yaml.comments import (  # pylint: disable=import-outside-toplevel
+            CommentedMap,
+        )
+
+        buffer = io.StringIO()
+        if isinstance(self.config, CommentedMap):
+            # the commented defaults need the ruamel round trip dumper to keep the
+            # comments - they are the documentation for a freshly created file
+            ruamel_yaml = YAML()
+            ruamel_yaml.indent(mapping=2, sequence=4, offset=2)
+            ruamel_yaml.dump(self.config, buffer)
+        else:
+            yaml.dump(
+                self.config,
+                buffer,
+                Dumper=YamlDumper,
+                default_flow_style=False,
+                sort_keys=False,
+                allow_unicode=True,
+            )
+        content = buffer.getvalue()
+
+        # write to a temporary file and move it into place - a crash while writing
+        # never leaves a truncated config.yaml behind
+        tmp_path = f"{self.config_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as tmp_file:
+                tmp_file.write(content)
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+            os.replace(tmp_path, self.config_file)
+        except OSError as e:
+            # e.g. config.yaml is a single file bind mount (docker) that can not be
+            # replaced - fall back to writing it in place
+            logger.debug(
+                "[Config] atomic write not possible (%s) - writing in place", e
+            )
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            with open(self.config_file, "w", encoding="utf-8") as config_file_handle:
+                config_file_handle.write(content)
+
+    def validate(self):
+        """
+        Checks that all required settings are present, of the expected type and within
+        their valid range.
+        """
+        errors = []
+        for path, expected_type in _SCHEMA_REQUIRED:
+            value = _get_path(self.config, path, _MISSING)
+            if value is _MISSING:
+                errors.append(f"'{path}' is missing")
+            elif isinstance(value, bool) or not isinstance(value, expected_type):
+                # bool is an int subclass, but never a valid number or port
+                errors.append(f"'{path}' has an invalid value: {value!r}")
+        if not errors:
+            # ranges are only checked once all types are known to be valid
+            for path, minimum, maximum in _SCHEMA_RANGES:
+                value = _get_path(self.config, path)
+                if (minimum is not None and value < minimum) or (
+                    maximum is not None and value > maximum
+                ):
+                    errors.append(
+                        f"'{path}' is out of range [{minimum}..{maximum or ''}]: {value}"
+                    )
+            battery = self.config["battery"]
+            if battery["min_soc_percentage"] > battery["max_soc_percentage"]:
+                errors.append(
+                    "'battery.min_soc_percentage' is greater than"
+                    " 'battery.max_soc_percentage'"
+                )
+        if errors:
+            for error in errors:
+                logger.error("[Config] %s - please adjust config.yaml", error)
+            raise ConfigError("; ".join(errors))
 
     def check_eos_timeout_and_refreshtime(self):
         """
         Check if the eos timeout is smaller than the refresh time
         """
-        eos_timeout_seconds = self.config["eos"]["timeout"]
-        refresh_time_seconds = self.config["refresh_time"] * 60
+        eos_timeout_seconds = self._flat["eos.timeout"]
+        refresh_time_seconds = self._flat["refresh_time"] * 60
 
         if eos_timeout_seconds > refresh_time_seconds:
             logger.error(
@@ -435,4 +413,4 @@ class ConfigManager:
                 eos_timeout_seconds,
                 refresh_time_seconds,
             )
-            sys.exit(0)
+            raise ConfigError("EOS timeout is greater than the refresh time")
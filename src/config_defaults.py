@@ -0,0 +1,348 @@
+"""
+This module builds the commented default configuration that is written to a new
+'config.yaml'. It is only imported when the defaults are actually needed, so a normal
+start with an existing config file does not pay for importing ruamel.yaml.
+"""
+
+from ruamel.yaml.comments import CommentedMap
+
+# comments written above the top level sections of the default config
+_SECTION_COMMENTS = (
+    ("load", "Load configuration"),
+    ("eos", "EOS server configuration"),
+    ("price", "Electricity price configuration"),
+    ("battery", "battery configuration"),
+    ("pv_forecast_source", "pv forecast source configuration"),
+    (
+        "pv_forecast",
+        "List of PV forecast configurations."
+        + " Add multiple entries as needed.\nSee Akkudoktor API "
+        + "(https://api.akkudoktor.net/#/pv%20generation%20calculation/getForecast) "
+        + "for more details.",
+    ),
+    ("inverter", "Inverter configuration"),
+    ("evcc", "EVCC configuration"),
+    ("mqtt", "MQTT configuration"),
+)
+
+
+# end of line comments for the 'load' section
+_LOAD_COMMENTS = (
+    (
+        "source",
+        "Data source for load power - openhab, homeassistant,"
+        + " default (using a static load profile)",
+    ),
+    ("access_token", "access token for homeassistant (optional)"),
+    (
+        "url",
+        "URL for openhab or homeassistant"
+        + " (e.g. http://openhab:8080 or http://homeassistant:8123)",
+    ),
+    ("load_sensor", "item / entity for load power data in watts"),
+    (
+        "car_charge_load_sensor",
+        "item / entity for wallbox power data in watts. "
+        + '(If not needed, set to `load.car_charge_load_sensor: ""`)',
+    ),
+    (
+        "additional_load_1_sensor",
+        "item / entity for additional load power data in watts."
+        + ' (If not needed set to `additional_load_1_sensor: ""`)',
+    ),
+    (
+        "additional_load_1_runtime",
+        "runtime for additional load 1 in minutes - default: 0"
+        + ' (If not needed set to `additional_load_1_sensor: ""`)',
+    ),
+    (
+        "additional_load_1_consumption",
+        "consumption for additional load 1 in Wh - default: 0"
+        + ' (If not needed set to `additional_load_1_sensor: ""`)',
+    ),
+)
+
+# end of line comments for the 'eos' section
+_EOS_COMMENTS = (
+    ("server", "EOS server address"),
+    ("port", "port for EOS server - default: 8503"),
+    ("timeout", "timeout for EOS optimize request in seconds - default: 180"),
+)
+
+# end of line comments for the 'price' section
+_PRICE_COMMENTS = (
+    (
+        "source",
+        "data source for electricity price tibber, smartenergy_at,"
+        + " fixed_24h, default (default uses akkudoktor)",
+    ),
+    ("token", "Token for electricity price"),
+    (
+        "fixed_24h_array",
+        "24 hours array with fixed end customer prices in ct/kWh over the day",
+    ),
+    ("feed_in_price", "feed in price for the grid in €/kWh"),
+    ("negative_price_switch", "switch for no payment if negative stock price is given"),
+)
+
+# end of line comments for the 'battery' section
+_BATTERY_COMMENTS = (
+    ("source", "Data source for battery soc - openhab, homeassistant, default"),
+    (
+        "url",
+        "URL for openhab or homeassistant"
+        + " (e.g. http://openhab:8080 or http://homeassistant:8123)",
+    ),
+    ("soc_sensor", "item / entity for battery SOC data in [0..1]"),
+    ("access_token", "access token for homeassistant (optional)"),
+    ("capacity_wh", "battery capacity in Wh"),
+    ("charge_efficiency", "efficiency for charging the battery in [0..1]"),
+    ("discharge_efficiency", "efficiency for discharging the battery in [0..1]"),
+    ("max_charge_power_w", "max charging power in W"),
+    ("min_soc_percentage", "URL for battery soc in %"),
+    ("max_soc_percentage", "URL for battery soc in %"),
+    ("price_euro_per_wh_accu", "price for battery in euro/Wh - default: 0.0"),
+    (
+        "charging_curve_enabled",
+        "enabling charging curve for controlled charging power"
+        + " according to the SOC (default: true)",
+    ),
+)
+
+# end of line comments for the 'pv_forecast_source' section
+_PV_FORECAST_SOURCE_COMMENTS = (
+    (
+        "source",
+        "data source for solar forecast providers akkudoktor, openmeteo, openmeteo_local,"
+        + " forecast_solar, evcc, default (default uses akkudoktor)",
+    ),
+)
+
+# end of line comments for each 'pv_forecast' entry
+_PV_FORECAST_COMMENTS = (
+    (
+        "name",
+        "User-defined identifier for the PV installation,"
+        + " have to be unique if you use more installations",
+    ),
+    ("lat", "Latitude for PV forecast"),
+    ("lon", "Longitude for PV forecast"),
+    ("azimuth", "Azimuth for PV forecast"),
+    ("tilt", "Tilt for PV forecast"),
+    ("power", "Power for PV forecast"),
+    ("powerInverter", "Power Inverter for PV forecast"),
+    ("inverterEfficiency", "Inverter Efficiency for PV forecast"),
+    (
+        "horizon",
+        "Horizon to calculate shading, up to 360 values"
+        + " to describe the shading situation for your PV.",
+    ),
+)
+
+# end of line comments for the 'inverter' section
+_INVERTER_COMMENTS = (
+    (
+        "type",
+        "Type of inverter - fronius_gen24, fronius_gen24_legacy, evcc, default"
+        + " (default will disable inverter control -"
+        + " only displaying the target state) - preset: default",
+    ),
+    ("address", "Address of the inverter (fronius_gen24/fronius_gen24_legacy only)"),
+    ("user", "Username for the inverter (fronius_gen24/fronius_gen24_legacy only)"),
+    ("password", "Password for the inverter (fronius_gen24/fronius_gen24_legacy only)"),
+    ("max_grid_charge_rate", "Max inverter grid charge rate in W - default: 5000"),
+    ("max_pv_charge_rate", "Max inverter PV charge rate in W - default: 5000"),
+)
+
+# end of line comments for the 'evcc' section
+_EVCC_COMMENTS = (
+    (
+        "url",
+        '# URL to your evcc installation, if not used set to ""'
+        + " or leave as http://yourEVCCserver:7070",
+    ),
+)
+
+# end of line comments for the 'mqtt' section
+_MQTT_COMMENTS = (
+    ("enabled", "Enable MQTT - default: false"),
+    ("broker", "URL for MQTT server - default: mqtt://yourMQTTserver"),
+    ("port", "Port for MQTT server - default: 1883"),
+    ("user", "Username for MQTT server - default: mqtt"),
+    ("password", "Password for MQTT server - default: mqtt"),
+    ("tls", "Use TLS for MQTT server - default: false"),
+    (
+        "ha_mqtt_auto_discovery",
+        "Enable Home Assistant MQTT auto discovery - default: true",
+    ),
+    (
+        "ha_mqtt_auto_discovery_prefix",
+        "Prefix for Home Assistant MQTT auto discovery - default: homeassistant",
+    ),
+)
+
+# end of line comments for the top level settings
+_TOP_LEVEL_COMMENTS = (
+    ("refresh_time", "Default refresh time of EOS connect in minutes - default: 3"),
+    ("time_zone", "Default time zone - default: Europe/Berlin"),
+    ("eos_connect_web_port", "Default port for EOS connect server - default: 8081"),
+    (
+        "log_level",
+        "Log level for the application : debug, info, warning, error - default: info",
+    ),
+)
+
+_SECTION_EOL_COMMENTS = (
+    ("load", _LOAD_COMMENTS),
+    ("eos", _EOS_COMMENTS),
+    ("price", _PRICE_COMMENTS),
+    ("battery", _BATTERY_COMMENTS),
+    ("pv_forecast_source", _PV_FORECAST_SOURCE_COMMENTS),
+    ("inverter", _INVERTER_COMMENTS),
+    ("evcc", _EVCC_COMMENTS),
+    ("mqtt", _MQTT_COMMENTS),
+)
+
+
+def _make_load():
+    load = CommentedMap()
+    load["source"] = "default"  # data source for load power
+    load["url"] = "http://homeassistant:8123"  # URL for openhab or homeassistant
+    load["access_token"] = "abc123"  # access token for homeassistant
+    load["load_sensor"] = "Load_Power"  # item / entity for load power data
+    load["car_charge_load_sensor"] = "Wallbox_Power"  # item / entity wallbox power
+    # item / entity for additional load power data
+    load["additional_load_1_sensor"] = "additional_load_1_sensor"
+    load["additional_load_1_runtime"] = 0  # runtime for additional load 1 in minutes
+    load["additional_load_1_consumption"] = 0  # consumption for additional load 1 in Wh
+    return load
+
+
+def _make_eos():
+    eos = CommentedMap()
+    eos["server"] = "192.168.100.100"  # Default EOS server address
+    eos["port"] = 8503  # Default port for EOS server
+    eos["timeout"] = 180  # Default timeout for EOS optimize request
+    return eos
+
+
+def _make_price():
+    price = CommentedMap()
+    price["source"] = "default"
+    price["token"] = "tibberBearerToken"  # token for electricity price
+    # 24 hours array with fixed end customer prices in ct/kWh over the day
+    price["fixed_24h_array"] = (
+        "10.1,10.1,10.1,10.1,10.1,23,28.23,28.23"
+        + ",28.23,28.23,28.23,23.52,23.52,23.52,23.52,28.17,28.17,34.28,"
+        + "34.28,34.28,34.28,34.28,28,23"
+    )
+    price["feed_in_price"] = 0.0  # feed in price for the grid
+    price["negative_price_switch"] = False  # switch for negative price
+    return price
+
+
+def _make_battery():
+    battery = CommentedMap()
+    battery["source"] = "default"  # data source for battery soc
+    battery["url"] = "http://homeassistant:8123"  # URL for openhab or homeassistant
+    battery["soc_sensor"] = "battery_SOC"  # item / entity for battery SOC data
+    battery["access_token"] = "abc123"  # access token for homeassistant
+    battery["capacity_wh"] = 11059
+    battery["charge_efficiency"] = 0.88
+    battery["discharge_efficiency"] = 0.88
+    battery["max_charge_power_w"] = 5000
+    battery["min_soc_percentage"] = 5
+    battery["max_soc_percentage"] = 100
+    battery["price_euro_per_wh_accu"] = 0.0  # price for battery in euro/Wh
+    battery["charging_curve_enabled"] = True  # enable charging curve
+    return battery
+
+
+def _make_pv_forecast_source():
+    pv_forecast_source = CommentedMap()
+    # openmeteo, openmeteo_local, forecast_solar, akkudoktor
+    pv_forecast_source["source"] = "akkudoktor"
+    return pv_forecast_source
+
+
+def _make_pv_forecast_entry():
+    pv_entry = CommentedMap()
+    # Placeholder for user-defined configuration name
+    pv_entry["name"] = "myPvInstallation1"
+    pv_entry["lat"] = 47.5  # Latitude for PV forecast
+    pv_entry["lon"] = 8.5  # Longitude for PV forecast
+    pv_entry["azimuth"] = 90.0  # Azimuth for PV forecast
+    pv_entry["tilt"] = 30.0  # Tilt for PV forecast
+    pv_entry["power"] = 4600  # Power of PV system in Wp
+    pv_entry["powerInverter"] = 5000  # Inverter Power
+    pv_entry["inverterEfficiency"] = 0.9  # Inverter Efficiency for PV forecast
+    pv_entry["horizon"] = "10,20,10,15"  # Horizon to calculate shading
+    return pv_entry
+
+
+def _make_inverter():
+    inverter = CommentedMap()
+    inverter["type"] = "default"
+    inverter["address"] = "192.168.1.12"
+    inverter["user"] = "customer"
+    inverter["password"] = "abc123"
+    inverter["max_grid_charge_rate"] = 5000
+    inverter["max_pv_charge_rate"] = 5000
+    return inverter
+
+
+def _make_evcc():
+    evcc = CommentedMap()
+    # URL to your evcc installation, if not used set to ""
+    # or leave as http://yourEVCCserver:7070
+    evcc["url"] = "http://yourEVCCserver:7070"
+    return evcc
+
+
+def _make_mqtt():
+    mqtt = CommentedMap()
+    mqtt["enabled"] = False  # Enable MQTT - default: false
+    # URL for MQTT server - default: mqtt://yourMQTTserver
+    mqtt["broker"] = "homeassistant"
+    mqtt["port"] = 1883  # Port for MQTT server - default: 1883
+    mqtt["user"] = "username"  # Username for MQTT server - default: mqtt
+    mqtt["password"] = "password"  # Password for MQTT server - default: mqtt
+    mqtt["tls"] = False  # Use TLS for MQTT server - default: false
+    # Enable Home Assistant MQTT auto discovery - default: true
+    mqtt["ha_mqtt_auto_discovery"] = True
+    # Prefix for Home Assistant MQTT auto discovery - default: homeassistant
+    mqtt["ha_mqtt_auto_discovery_prefix"] = "homeassistant"
+    return mqtt
+
+
+def build_default_config():
+    """
+    Creates the default configuration with comments.
+    """
+    config = CommentedMap()
+    config["load"] = _make_load()
+    config["eos"] = _make_eos()
+    config["price"] = _make_price()
+    config["battery"] = _make_battery()
+    config["pv_forecast_source"] = _make_pv_forecast_source()
+    config["pv_forecast"] = [_make_pv_forecast_entry()]
+    config["inverter"] = _make_inverter()
+    config["evcc"] = _make_evcc()
+    config["mqtt"] = _make_mqtt()
+    config["refresh_time"] = 3  # Default refresh time in minutes
+    config["time_zone"] = "Europe/Berlin"  # Add default time zone
+    config["eos_connect_web_port"] = 8081  # Default port for EOS connect server
+    config["log_level"] = "info"  # Default log level
+
+    for key, comment in _SECTION_COMMENTS:
+        config.yaml_set_comment_before_after_key(key, before=comment)
+
+    for key, comment in _TOP_LEVEL_COMMENTS:
+        config.yaml_add_eol_comment(comment, key)
+    for section, comments in _SECTION_EOL_COMMENTS:
+        for key, comment in comments:
+            config[section].yaml_add_eol_comment(comment, key)
+    for pv_entry in config["pv_forecast"]:
+        for key, comment in _PV_FORECAST_COMMENTS:
+            pv_entry.yaml_add_eol_comment(comment, key)
+    return config
@@ -4,17 +4,18 @@ This module fetches energy data from OpenHAB, processes it, and creates a load p
 
 import os
 import sys
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 import time
 import logging
-import json
 import threading
+import orjson
 import pytz
 import requests
-from flask import Flask, Response, render_template_string, request
+from flask import Flask, Response, request
 from gevent.pywsgi import WSGIServer
 from version import __version__
-from config import ConfigManager
+from config import ConfigManager, ConfigError, ConfigCreatedError
 from interfaces.base_control import BaseControl
 from interfaces.load_interface import LoadInterface
 from interfaces.battery_interface import BatteryInterface
@@ -51,11 +52,20 @@ class TimezoneFormatter(logging.Formatter):
     def __init__(self, fmt=None, datefmt=None, tz=None):
         super().__init__(fmt, datefmt)
         self.tz = tz
+        # (second, datefmt) and formatted time of the last record - the timestamps
+        # have a resolution of one second, so records within the same second share it
+        self._last_time = (None, None)
+        self._last_time_str = ""
 
     def formatTime(self, record, datefmt=None):
+        key = (int(record.created), datefmt)
+        if key == self._last_time:
+            return self._last_time_str
         # Convert the record's timestamp to the configured timezone
-        record_time = datetime.fromtimestamp(record.created, self.tz)
-        return record_time.strftime(datefmt or self.default_time_format)
+        record_time = datetime.fromtimestamp(key[0], self.tz)
+        self._last_time_str = record_time.strftime(datefmt or self.default_time_format)
+        self._last_time = key
+        return self._last_time_str
 
 
 ###################################################################################################
@@ -78,8 +88,18 @@ if len(sys.argv) > 1:
 else:
     current_dir = base_path
 ###################################################################################################
-config_manager = ConfigManager(current_dir)
+try:
+    config_manager = ConfigManager(current_dir)
+except ConfigCreatedError:
+    sys.exit(0)  # new default config written - nothing to run with yet
+except ConfigError as config_error:
+    logger.error("[Main] Invalid configuration: %s", config_error)
+    sys.exit(1)
 time_zone = pytz.timezone(config_manager.config["time_zone"])
+# the config is not reloaded at runtime - bind the sections used on every run once
+battery_config = config_manager.config["battery"]
+inverter_config = config_manager.config["inverter"]
+load_config = config_manager.config["load"]
 
 LOGLEVEL = config_manager.config["log_level"].upper()
 logger.setLevel(LOGLEVEL)
@@ -246,7 +266,9 @@ battery_interface = BatteryInterface(
     on_bat_max_changed=None,
 )
 
-price_interface = PriceInterface(config_manager.config["price"])
+price_interface = PriceInterface(
+    config_manager.config["price"], time_zone, EOS_TGT_DURATION
+)
 
 pv_interface = PvInterface(
     config_manager.config["pv_forecast_source"],
@@ -256,9 +278,11 @@ pv_interface = PvInterface(
 )
 
 # wait for the interfaces to initialize - depend on entries for pv_forecast
+# (returns as soon as the first pv forecast is available, init_time is the upper bound)
 init_time = 3 + 1 * len(config_manager.config["pv_forecast"])
-logger.info("[Main] Waiting %s seconds for interfaces to initialize", init_time)
-time.sleep(init_time)
+logger.info("[Main] Waiting up to %s seconds for interfaces to initialize", init_time)
+if not pv_interface.wait_for_first_update(init_time):
+    logger.warning("[Main] PV forecast not yet available - continuing startup")
 
 # pv_interface.test_output()
 # sys.exit(0)  # exit if the interfaces are not initialized correctly
@@ -281,31 +305,19 @@ def create_optimize_request():
             "pv_prognose_wh": pv_interface.get_current_pv_forecast(),
             "strompreis_euro_pro_wh": price_interface.get_current_prices(),
             "einspeiseverguetung_euro_pro_wh": price_interface.get_current_feedin_prices(),
-            "preis_euro_pro_wh_akku": config_manager.config["battery"][
-                "price_euro_per_wh_accu"
-            ],
+            "preis_euro_pro_wh_akku": battery_config["price_euro_per_wh_accu"],
             "gesamtlast": load_interface.get_load_profile(EOS_TGT_DURATION),
         }
 
     def get_pv_akku_data():
         akku_object = {
-            "capacity_wh": config_manager.config["battery"]["capacity_wh"],
-            "charging_efficiency": config_manager.config["battery"][
-                "charge_efficiency"
-            ],
-            "discharging_efficiency": config_manager.config["battery"][
-                "discharge_efficiency"
-            ],
-            "max_charge_power_w": config_manager.config["battery"][
-                "max_charge_power_w"
-            ],
+            "capacity_wh": battery_config["capacity_wh"],
+            "charging_efficiency": battery_config["charge_efficiency"],
+            "discharging_efficiency": battery_config["discharge_efficiency"],
+            "max_charge_power_w": battery_config["max_charge_power_w"],
             "initial_soc_percentage": round(battery_interface.get_current_soc()),
-            "min_soc_percentage": config_manager.config["battery"][
-                "min_soc_percentage"
-            ],
-            "max_soc_percentage": config_manager.config["battery"][
-                "max_soc_percentage"
-            ],
+            "min_soc_percentage": battery_config["min_soc_percentage"],
+            "max_soc_percentage": battery_config["max_soc_percentage"],
         }
         if eos_interface.get_eos_version() == ">=2025-04-09":
             akku_object = {"device_id": "battery1", **akku_object}
@@ -313,7 +325,7 @@ def create_optimize_request():
 
     def get_wechselrichter_data():
         wechselrichter_object = {
-            "max_power_wh": config_manager.config["inverter"]["max_pv_charge_rate"],
+            "max_power_wh": inverter_config["max_pv_charge_rate"],
         }
         if eos_interface.get_eos_version() == ">=2025-04-09":
             wechselrichter_object = {
@@ -338,12 +350,10 @@ def create_optimize_request():
         return eauto_object
 
     def get_dishwasher_data():
-        consumption_wh = config_manager.config["load"].get(
-            "additional_load_1_consumption", 1
-        )
+        consumption_wh = load_config.get("additional_load_1_consumption", 1)
         if not consumption_wh or consumption_wh == 0:
             consumption_wh = 1
-        duration_h = config_manager.config["load"].get("additional_load_1_runtime", 1)
+        duration_h = load_config.get("additional_load_1_runtime", 1)
         if not duration_h or duration_h == 0:
             duration_h = 1
         dishwasher_object = {
@@ -380,7 +390,7 @@ def setting_control_data(ac_charge_demand_rel, dc_charge_demand_rel, discharge_a
     """
     # Safety check: Prevent AC charging if battery SoC exceeds maximum
     current_soc = battery_interface.get_current_soc()
-    max_soc = config_manager.config["battery"]["max_soc_percentage"]
+    max_soc = battery_config["max_soc_percentage"]
 
     if current_soc >= max_soc and ac_charge_demand_rel > 0:
         logger.warning(
@@ -415,6 +425,51 @@ def setting_control_data(ac_charge_demand_rel, dc_charge_demand_rel, discharge_a
     base_control.set_current_evcc_charging_mode(evcc_interface.get_charging_mode())
 
 
+def write_file_atomic(path, content):
+    """
+    Writes the given string to the file at once - into a temporary file that replaces
+    the target afterwards, so a reader never sees a partially written file.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb", buffering=0) as file:
+        file.write(content.encode("utf-8"))
+    os.replace(tmp_path, path)
+
+
+# writes the optimize json files without blocking the optimization run
+file_write_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="json_write")
+
+
+def write_file_in_background(path, content):
+    """
+    Queues the given string to be written to the file by the file write pool.
+    Errors are only logged - the optimization run does not wait for the write.
+    """
+
+    def log_write_error(future):
+        error = future.exception()
+        if error is not None:
+            logger.error("[Main] Could not write %s: %s", path, error)
+
+    file_write_pool.submit(write_file_atomic, path, content).add_done_callback(
+        log_write_error
+    )
+
+
+OPTIMIZE_REQUEST_FILE = os.path.join(base_path, "json", "optimize_request.json")
+OPTIMIZE_RESPONSE_FILE = os.path.join(base_path, "json", "optimize_response.json")
+os.makedirs(os.path.dirname(OPTIMIZE_REQUEST_FILE), exist_ok=True)
+
+
+def dumps_optimize_json(data):
+    """
+    Serializes an optimize request/response to an indented json string with orjson.
+    """
+    return orjson.dumps(
+        data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+    ).decode("utf-8")
+
+
 class OptimizationScheduler:
     """
     A scheduler class that manages the periodic execution of an optimization process
@@ -434,13 +489,12 @@ class OptimizationScheduler:
     def __init__(self, update_interval):
         self.update_interval = update_interval
         self.last_request_response = {
-            "request": json.dumps(
+            "request": dumps_optimize_json(
                 {
                     "status": "Awaiting first optimization run",
                 },
-                indent=4,
             ),
-            "response": json.dumps(
+            "response": dumps_optimize_json(
                 {
                     "status": "starting up",
                     "message": (
@@ -448,7 +502,6 @@ class OptimizationScheduler:
                         "the completion of the first optimization run."
                     ),
                 },
-                indent=4,
             ),
         }
         self.current_state = {
@@ -522,13 +575,10 @@ class OptimizationScheduler:
                 self.run_optimization()
             except (requests.exceptions.RequestException, ValueError, KeyError) as e:
                 logger.error("[OPTIMIZATION] Error while updating state: %s", e)
-                # Break the sleep interval into smaller chunks to allow immediate shutdown
-            sleep_interval = self.update_interval
-            while sleep_interval > 0:
-                if self._stop_event.is_set():
-                    return  # Exit immediately if stop event is set
-                time.sleep(min(1, sleep_interval))  # Sleep in 1-second chunks
-                sleep_interval -= 1
+            # wait for the next run - returns immediately if the stop event is set,
+            # the timeout runs on the monotonic clock (not affected by clock changes)
+            if self._stop_event.wait(self.update_interval):
+                return
 
         self.start_update_service()
 
@@ -550,46 +600,45 @@ class OptimizationScheduler:
             or EOS interface communication will propagate to the caller.
         Notes:
             - The method assumes the presence of global variables or objects such as
-              `logger`, `base_path`, `eos_interface`, `config_manager`, and `time_zone`.
-            - The `config_manager.config` dictionary is expected to contain the
-              necessary configuration values for "eos.timeout" and "refresh_time".
+              `logger`, `base_path`, `eos_interface`, and `time_zone`.
+            - "eos.timeout" and "refresh_time" are read from the config once, when
+              the scheduler is created.
         """
         logger.info("[Main] start new run")
-        # update prices
-        price_interface.update_prices(
-            EOS_TGT_DURATION,
-            datetime.now(time_zone).replace(hour=0, minute=0, second=0, microsecond=0),
-        )
+        # prices are updated in the background - only the very first run has to wait
+        if not price_interface.wait_for_first_update(30):
+            logger.warning("[Main] Prices not yet available - using current values")
         # create optimize request
         json_optimize_input = create_optimize_request()
         self.__set_state_request()
 
-        with open(
-            base_path + "/json/optimize_request.json", "w", encoding="utf-8"
-        ) as file:
-            json.dump(json_optimize_input, file, indent=4)
+        # the files are debug artifacts only - the web interface serves the last
+        # request/response from memory
+        dump_json_files = logger.isEnabledFor(logging.DEBUG)
+        if dump_json_files:
+            # serialize in one pass (before the request is extended below) and write
+            # the file in the background while EOS is optimizing
+            write_file_in_background(
+                OPTIMIZE_REQUEST_FILE, dumps_optimize_json(json_optimize_input)
+            )
 
         mqtt_interface.update_publish_topics(
             {"optimization/state": {"value": self.get_current_state()["request_state"]}}
         )
         optimized_response = eos_interface.eos_set_optimize_request(
-            json_optimize_input, config_manager.config["eos"]["timeout"]
+            json_optimize_input, config_manager.get("eos.timeout")
         )
 
         json_optimize_input["timestamp"] = datetime.now(time_zone).isoformat()
-        self.last_request_response["request"] = json.dumps(
-            json_optimize_input, indent=4
-        )
+        self.last_request_response["request"] = dumps_optimize_json(json_optimize_input)
         optimized_response["timestamp"] = datetime.now(time_zone).isoformat()
-        self.last_request_response["response"] = json.dumps(
-            optimized_response, indent=4
-        )
+        self.last_request_response["response"] = dumps_optimize_json(optimized_response)
         self.__set_state_response()
 
-        with open(
-            base_path + "/json/optimize_response.json", "w", encoding="utf-8"
-        ) as file:
-            json.dump(optimized_response, file, indent=4)
+        if dump_json_files:
+            write_file_in_background(
+                OPTIMIZE_RESPONSE_FILE, self.last_request_response["response"]
+            )
         # +++++++++
         ac_charge_demand, dc_charge_demand, discharge_allowed, error = (
             eos_interface.examine_response_to_control_data(optimized_response)
@@ -606,14 +655,13 @@ class OptimizationScheduler:
             change_control_state()
         # +++++++++
 
-        loop_now = datetime.now(time_zone)
-        # Reset base to full minutes on the clock
-        next_eval = loop_now.replace(microsecond=0)
-        # Add the update interval to calculate the next evaluation time
-        next_eval += timedelta(seconds=self.update_interval)
-        sleeptime = (next_eval - loop_now).total_seconds()
+        loop_now = time.time()
+        # next evaluation: full seconds on the clock plus the update interval
+        next_eval_ts = int(loop_now) + self.update_interval
+        sleeptime = next_eval_ts - loop_now
         minutes, seconds = divmod(sleeptime, 60)
-        self.__set_state_next_run(next_eval.astimezone(time_zone).isoformat())
+        next_eval = datetime.fromtimestamp(next_eval_ts, time_zone)
+        self.__set_state_next_run(next_eval.isoformat())
         mqtt_interface.update_publish_topics(
             {
                 "optimization/last_run": {
@@ -657,13 +705,9 @@ class OptimizationScheduler:
                 logger.error(
                     "[OPTIMIZATION] Error while updating inverter data state: %s", e
                 )
-                # Break the sleep interval into smaller chunks to allow immediate shutdown
-            sleep_interval = 15
-            while sleep_interval > 0:
-                if self._stop_event_inner_loop.is_set():
-                    return  # Exit immediately if stop event is set
-                time.sleep(min(1, sleep_interval))  # Sleep in 1-second chunks
-                sleep_interval -= 1
+            # wait for the next run - returns immediately if the stop event is set
+            if self._stop_event_inner_loop.wait(15):
+                return
         self.__start_update_service_inner_loop()
 
     def __run_inner_loop(self):
@@ -723,7 +767,7 @@ class OptimizationScheduler:
 
 
 optimization_scheduler = OptimizationScheduler(
-    config_manager.config["refresh_time"] * 60  # convert to seconds
+    config_manager.get("refresh_time") * 60  # convert to seconds
 )
 
 
@@ -748,7 +792,7 @@ def change_control_state():
     inverter_evcc_en = False
     if inverter_type in ["fronius_gen24", "fronius_gen24_legacy"]:
         inverter_fronius_en = True
-    elif config_manager.config["inverter"]["type"] == "evcc":
+    elif inverter_config["type"] == "evcc":
         inverter_evcc_en = True
 
     current_overall_state = base_control.get_current_overall_state_number()
@@ -896,17 +940,37 @@ mqtt_interface.on_mqtt_command = mqtt_control_callback
 # web server
 app = Flask(__name__)
 
+# path -> (mtime_ns, content) of the files served from disk
+file_cache = {}
+
+
+def read_cached_file(path):
+    """
+    Returns the content of the given file as bytes - cached in memory and only read
+    again from disk if the file was modified.
+    """
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = file_cache.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    with open(path, "rb") as file:
+        content = file.read()
+    file_cache[path] = (mtime_ns, content)
+    return content
+
 
 @app.route("/", methods=["GET"])
 def main_page():
     """
     Renders the main page of the web application.
 
-    This function reads the content of the 'index.html' file located in the 'web' directory
-    and returns it as a rendered template string.
+    This function returns the content of the 'index.html' file located in the 'web'
+    directory (the page is static - no template rendering needed).
     """
-    with open(base_path + "/web/index.html", "r", encoding="utf-8") as html_file:
-        return render_template_string(html_file.read())
+    return Response(
+        read_cached_file(base_path + "/web/index.html"),
+        content_type="text/html; charset=utf-8",
+    )
 
 
 @app.route("/style.css", methods=["GET"])
@@ -917,8 +981,9 @@ def style_css():
     This function reads the content of the 'style.css' file located in the 'web' directory
     and returns it as a response with the appropriate content type.
     """
-    with open(base_path + "/web/style.css", "r", encoding="utf-8") as css_file:
-        return Response(css_file.read(), content_type="text/css")
+    return Response(
+        read_cached_file(base_path + "/web/style.css"), content_type="text/css"
+    )
 
 
 @app.route("/json/optimize_request.json", methods=["GET"])
@@ -942,27 +1007,27 @@ def get_optimize_response():
         content_type="application/json",
     )
 
+
 @app.route("/json/optimize_request.test.json", methods=["GET"])
 def get_optimize_request_test():
     """
     Retrieves the last optimization request and returns it as a JSON response.
     """
-    with open(base_path + "/json/optimize_request.test.json", "r", encoding="utf-8") as file:
-        return Response(
-            file.read(),
-            content_type="application/json",
-        )
+    return Response(
+        read_cached_file(base_path + "/json/optimize_request.test.json"),
+        content_type="application/json",
+    )
+
 
 @app.route("/json/optimize_response.test.json", methods=["GET"])
 def get_optimize_response_test():
     """
     Retrieves the last optimization response and returns it as a JSON response.
     """
-    with open(base_path + "/json/optimize_response.test.json", "r", encoding="utf-8") as file:
-        return Response(
-            file.read(),
-            content_type="application/json",
-        )
+    return Response(
+        read_cached_file(base_path + "/json/optimize_response.test.json"),
+        content_type="application/json",
+    )
 
 
 @app.route("/json/current_controls.json", methods=["GET"])
@@ -997,9 +1062,7 @@ def get_controls():
             "soc": current_battery_soc,
             "usable_capacity": battery_interface.get_current_usable_capacity(),
             "max_charge_power_dyn": battery_interface.get_max_charge_power(),
-            "max_grid_charge_rate": config_manager.config["inverter"][
-                "max_grid_charge_rate"
-            ],
+            "max_grid_charge_rate": inverter_config["max_grid_charge_rate"],
         },
         "inverter": {
             "inverter_special_data": (
@@ -1014,8 +1077,13 @@ def get_controls():
         "timestamp": datetime.now(time_zone).isoformat(),
         "api_version": "0.0.1",
     }
+    # polled by the dashboard - serialize straight to bytes and never cache
     return Response(
-        json.dumps(response_data, indent=4), content_type="application/json"
+        orjson.dumps(
+            response_data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ),
+        content_type="application/json",
+        headers={"Cache-Control": "no-cache"},
     )
 
 
@@ -1042,7 +1110,7 @@ def handle_mode_override():
             or "grid_charge_power" not in data
         ):
             return Response(
-                json.dumps({"error": "Invalid payload"}),
+                orjson.dumps({"error": "Invalid payload"}),
                 status=400,
                 content_type="application/json",
             )
@@ -1057,13 +1125,13 @@ def handle_mode_override():
         # Validate mode and duration
         if mode < -2 or mode > 2:
             return Response(
-                json.dumps({"error": "Invalid mode value"}),
+                orjson.dumps({"error": "Invalid mode value"}),
                 status=400,
                 content_type="application/json",
             )
         if duration <= 0 and duration <= 12 * 60:
             return Response(
-                json.dumps(
+                orjson.dumps(
                     {
                         "error": "Duration must be greater than 0 and less/ equal than 12 hours"
                     }
@@ -1073,11 +1141,10 @@ def handle_mode_override():
             )
         if (
             grid_charge_power < 0.5
-            and grid_charge_power
-            <= config_manager.config["inverter"]["max_grid_charge_rate"] / 1000
+            and grid_charge_power <= inverter_config["max_grid_charge_rate"] / 1000
         ):
             return Response(
-                json.dumps(
+                orjson.dumps(
                     {
                         "error": "Grid charge power must be greater than 0"
                         + " and less / equal than max grid charge rate"
@@ -1100,27 +1167,27 @@ def handle_mode_override():
             )
 
         return Response(
-            json.dumps({"status": "success", "message": "Mode override applied"}),
+            orjson.dumps({"status": "success", "message": "Mode override applied"}),
             content_type="application/json",
         )
     except ValueError as e:
         logger.error("[Main] Value error in mode override: %s", e)
         return Response(
-            json.dumps({"error": "Invalid input"}),
+            orjson.dumps({"error": "Invalid input"}),
             status=400,
             content_type="application/json",
         )
     except TypeError as e:
         logger.error("[Main] Type error in mode override: %s", e)
         return Response(
-            json.dumps({"error": "Invalid data type"}),
+            orjson.dumps({"error": "Invalid data type"}),
             status=400,
             content_type="application/json",
         )
     except KeyError as e:
         logger.error("[Main] Key error in mode override: %s", e)
         return Response(
-            json.dumps({"error": "Missing or invalid key in input data"}),
+            orjson.dumps({"error": "Missing or invalid key in input data"}),
             status=400,
             content_type="application/json",
         )
@@ -1173,12 +1240,13 @@ if __name__ == "__main__":
 
         # restore the old config
         if (
-            config_manager.config["inverter"]["type"]
-            in ["fronius_gen24", "fronius_gen24_v2"]
+            inverter_config["type"] in ["fronius_gen24", "fronius_gen24_v2"]
             and inverter_interface is not None
         ):
             inverter_interface.shutdown()
         pv_interface.shutdown()
+        load_interface.shutdown()
+        price_interface.shutdown()
         mqtt_interface.shutdown()
         evcc_interface.shutdown()
         battery_interface.shutdown()
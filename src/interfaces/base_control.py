@@ -445,11 +445,8 @@ class BaseControl:
         while not self._stop_event.is_set():
             self.__set_current_overall_state()
 
-            sleep_interval = self.update_interval
-            while sleep_interval > 0:
-                if self._stop_event.is_set():
-                    return  # Exit immediately if stop event is set
-                time.sleep(min(1, sleep_interval))  # Sleep in 1-second chunks
-                sleep_interval -= 1
+            # wait for the next update - returns immediately if the stop event is set
+            if self._stop_event.wait(self.update_interval):
+                return
 
         self.__start_update_service()
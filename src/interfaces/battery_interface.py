@@ -38,7 +38,6 @@ Example:
 
 import logging
 import threading
-import time
 import requests
 
 logger = logging.getLogger("__main__")
@@ -338,12 +337,8 @@ class BatteryInterface:
 
             except (requests.exceptions.RequestException, ValueError, KeyError) as e:
                 logger.error("[BATTERY-IF] Error while updating state: %s", e)
-                # Break the sleep interval into smaller chunks to allow immediate shutdown
-            sleep_interval = self.update_interval
-            while sleep_interval > 0:
-                if self._stop_event.is_set():
-                    return  # Exit immediately if stop event is set
-                time.sleep(min(1, sleep_interval))  # Sleep in 1-second chunks
-                sleep_interval -= 1
+            # wait for the next update - returns immediately if the stop event is set
+            if self._stop_event.wait(self.update_interval):
+                return
 
         self.start_update_service()
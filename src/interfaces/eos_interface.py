@@ -21,15 +21,44 @@ Usage:
 
 import logging
 import time
-import json
 from datetime import datetime
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
 import numpy as np
 
 logger = logging.getLogger("__main__")
 logger.info("[EOS] loading module ")
 
+# an unreachable EOS server fails fast - the timeout of the optimize request itself
+# only applies to waiting for the (long running) optimization result
+EOS_CONNECT_TIMEOUT = 2  # seconds
+
+
+def _find_non_finite(value, path="payload"):
+    """
+    Returns the path of the first NaN or infinite number in the given payload, None if
+    all numbers are finite - orjson would silently serialize them as null.
+    """
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, (list, tuple)):
+        items = enumerate(value)
+    elif isinstance(value, np.ndarray):
+        if value.dtype.kind == "f" and not np.isfinite(value).all():
+            return path
+        return None
+    elif isinstance(value, (float, np.floating)):
+        return None if np.isfinite(value) else path
+    else:
+        return None
+    for key, item in items:
+        found = _find_non_finite(item, f"{path}[{key!r}]")
+        if found is not None:
+            return found
+    return None
+
 
 # EOS_API_PUT_LOAD_SERIES = {
 #     f"http://{EOS_SERVER}:{EOS_SERVER_PORT}/v1/measurement/load-mr/series/by-name"  #
@@ -72,6 +101,9 @@ class EosInterface:
         self.home_appliance_released = False
         self.home_appliance_start_hour = None
         self.eos_version = None
+        # one session for the EOS server - keeps the connection alive between the runs
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=2))
         self.eos_version = self.__retrieve_eos_version()
 
     # EOS basic API helper
@@ -80,9 +112,9 @@ class EosInterface:
         Set a configuration value on the EOS server.
         """
         if isinstance(value, list):
-            value = json.dumps(value)
+            value = orjson.dumps(value).decode()
         params = {"key": key, "value": value}
-        response = requests.put(
+        response = self.session.put(
             self.base_url + "/v1/config/value", params=params, timeout=10
         )
         response.raise_for_status()
@@ -99,7 +131,7 @@ class EosInterface:
             "dtype": "float64",
             "tz": "UTC",
         }
-        response = requests.put(
+        response = self.session.put(
             self.base_url
             + "/v1/measurement/load-mr/series/by-name"
             + "?name=Household",
@@ -132,10 +164,26 @@ class EosInterface:
             request_url,
             timeout,
         )
+        non_finite = _find_non_finite(payload)
+        if non_finite is not None:
+            # the stdlib json used by requests refused these values - do not send
+            # null instead of a number to the optimization
+            logger.error(
+                "[EOS] OPTIMIZE request not sent - %s is not a finite number",
+                non_finite,
+            )
+            return {"error": f"{non_finite} is not a finite number"}
+        response = None
         try:
+            # orjson serializes the forecast arrays much faster than the stdlib json
+            # requests would use for json=payload
+            body = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
             start_time = time.time()
-            response = requests.post(
-                request_url, headers=headers, json=payload, timeout=timeout
+            response = self.session.post(
+                request_url,
+                headers=headers,
+                data=body,
+                timeout=(EOS_CONNECT_TIMEOUT, timeout),
             )
             end_time = time.time()
             elapsed_time = end_time - start_time
@@ -146,10 +194,19 @@ class EosInterface:
                 seconds,
             )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
+        except requests.exceptions.ConnectTimeout:
+            logger.error(
+                "[EOS] OPTIMIZE Could not connect to EOS server within %s seconds",
+                EOS_CONNECT_TIMEOUT,
+            )
+            return {"error": "EOS server not reachable - trying again with next run"}
         except requests.exceptions.Timeout:
             logger.error("[EOS] OPTIMIZE Request timed out after %s seconds", timeout)
             return {"error": "Request timed out - trying again with next run"}
+        except orjson.JSONDecodeError as e:
+            logger.error("[EOS] OPTIMIZE Failed to decode response: %s", e)
+            return {"error": str(e)}
         except requests.exceptions.RequestException as e:
             logger.error(
                 "[EOS] OPTIMIZE Request failed: %s - response: %s", e, response
@@ -164,7 +221,7 @@ class EosInterface:
                 "[EOS] OPTIMIZE ERROR - response of EOS is:"+
                 "\n---RESPONSE-------------------------------------------------\n %s"+
                 "\n------------------------------------------------------------",
-                 response.text
+                 response.text if response is not None else None
             )            
             return {"error": str(e)}
 
@@ -265,7 +322,7 @@ class EosInterface:
         """
         Save the current configuration to the configuration file on the EOS server.
         """
-        response = requests.put(self.base_url + "/v1/config/file", timeout=10)
+        response = self.session.put(self.base_url + "/v1/config/file", timeout=10)
         response.raise_for_status()
         logger.debug("[EOS] CONFIG saved to config file successfully.")
 
@@ -274,7 +331,9 @@ class EosInterface:
         Update the current configuration from the configuration file on the EOS server.
         """
         try:
-            response = requests.post(self.base_url + "/v1/config/update", timeout=10)
+            response = self.session.post(
+                self.base_url + "/v1/config/update", timeout=10
+            )
             response.raise_for_status()
             logger.info("[EOS] CONFIG Config updated from config file successfully.")
         except requests.exceptions.Timeout:
@@ -343,26 +402,22 @@ class EosInterface:
         """
 
         # create a list of all dates in the year
-        dates = pd.date_range(start="1/1/2025", end="31/12/2025", freq="H")
-        # create an empty dataframe with the dates as index
-        df = pd.DataFrame(index=dates)
-        # add a column 'Household' to the dataframe with NaN values
-        df["Household"] = np.nan
-        # iterate over the profile and set the energy values in the dataframe
-        for entry in profile:
-            month = entry[0]
-            weekday = entry[1]
-            hour = entry[2]
-            energy = entry[3]
-            # get the dates that match the month, weekday and hour
-            dates = df[
-                (df.index.month == month)
-                & (df.index.weekday == weekday)
-                & (df.index.hour == hour)
-            ].index
-            # set the energy value for the dates
-            for date in dates:
-                df.loc[date, "Household"] = energy
+        dates = pd.date_range(start="2025-01-01", end="2025-12-31", freq="h")
+        # flat lookup table month x weekday x hour -> energy, NaN if not in the profile
+        # key = (month - 1) * 168 + weekday * 24 + hour
+        entries = np.asarray(profile, dtype=np.float64).reshape(-1, 4)
+        keys = entries[:, :3].astype(np.int64)
+        lut = np.full(12 * 7 * 24, np.nan)
+        lut[(keys[:, 0] - 1) * 168 + keys[:, 1] * 24 + keys[:, 2]] = entries[:, 3]
+        # pylint can not infer the datetime fields of a DatetimeIndex
+        # pylint: disable=no-member
+        months = dates.month.to_numpy(dtype=np.int64)
+        weekdays = dates.weekday.to_numpy(dtype=np.int64)
+        hours = dates.hour.to_numpy(dtype=np.int64)
+        # pylint: enable=no-member
+        # gather the energy values for all dates at once and wrap them only once
+        values = lut[(months - 1) * 168 + weekdays * 24 + hours]
+        df = pd.DataFrame({"Household": values}, index=dates)
         return df
 
     def __retrieve_eos_version(self):
@@ -374,9 +429,9 @@ class EosInterface:
             str: The EOS version.
         """
         try:
-            response = requests.get(self.base_url + "/v1/health", timeout=10)
+            response = self.session.get(self.base_url + "/v1/health", timeout=10)
             response.raise_for_status()
-            eos_version = response.json().get("status")
+            eos_version = orjson.loads(response.content).get("status")
             if eos_version == "alive":
                 eos_version = ">=2025-04-09"
             logger.info("[EOS] Getting EOS version: %s", eos_version)
@@ -408,7 +463,7 @@ class EosInterface:
         except requests.exceptions.RequestException as e:
             logger.error("[EOS] Failed to get EOS version - Error: %s", e)
             return None
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error("[EOS] Failed to decode EOS version response: %s", e)
             return None
 
@@ -23,7 +23,6 @@ Usage:
 
 import logging
 import threading
-import time
 import requests
 
 logger = logging.getLogger("__main__")
@@ -267,12 +266,8 @@ class EvccInterface:
                     # EVCC server unreachable, use last known values and continue
                     logger.warning("[EVCC] Server unreachable, using last known values")
                     # Skip this iteration but don't break the loop
-                    sleep_interval = self.update_interval
-                    while sleep_interval > 0:
-                        if self._stop_event.is_set():
-                            return
-                        time.sleep(min(1, sleep_interval))
-                        sleep_interval -= 1
+                    if self._stop_event.wait(self.update_interval):
+                        return
                     continue
 
                 loadpoints, vehicles = result
@@ -293,13 +288,9 @@ class EvccInterface:
                     + " Continuing with last known values",
                     e,
                 )
-            # Break the sleep interval into smaller chunks to allow immediate shutdown
-            sleep_interval = self.update_interval
-            while sleep_interval > 0:
-                if self._stop_event.is_set():
-                    return  # Exit immediately if stop event is set
-                time.sleep(min(1, sleep_interval))  # Sleep in 1-second chunks
-                sleep_interval -= 1
+            # wait for the next update - returns immediately if the stop event is set
+            if self._stop_event.wait(self.update_interval):
+                return
 
     def __get_evcc_loadpoints_vehicles(self):
         data = self.__fetch_evcc_state_via_api()
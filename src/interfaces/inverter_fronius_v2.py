@@ -588,7 +588,8 @@ class FroniusWRV2:
             config = {"timeofuse": timeofuse_list}
             endpoint = "/config/timeofuse"
 
-            logger.debug(f"[InverterV2] Setting timeofuse config: {config}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[InverterV2] Setting timeofuse config: {config}")
 
             response = self._make_authenticated_request("POST", endpoint, data=config)
 
@@ -915,7 +916,10 @@ class FroniusWRV2:
                 ),
             }
 
-            logger.debug(f"[InverterV2] Inverter data: {self.inverter_current_data}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"[InverterV2] Inverter data: {self.inverter_current_data}"
+                )
             return self.inverter_current_data
 
         except (requests.RequestException, ValueError, KeyError) as e:
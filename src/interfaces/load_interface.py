@@ -5,6 +5,7 @@ load profiles based on historical energy consumption data.
 """
 
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from urllib.parse import quote
 import zoneinfo
@@ -54,8 +55,21 @@ class LoadInterface:
         else:
             self.time_zone = timezone
 
+        # (day, load profile) - the history of past days does not change during a day
+        self._load_profile_cache = None
+        # the history of the four days of a load profile is fetched in parallel
+        self._load_profile_pool = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="load_profile"
+        )
+
         self.__check_config()
 
+    def shutdown(self):
+        """
+        Shuts down the worker threads of the load profile requests.
+        """
+        self._load_profile_pool.shutdown(wait=False, cancel_futures=True)
+
     def __check_config(self):
         """
         Checks if the configuration is valid.
@@ -99,6 +113,7 @@ class LoadInterface:
     ):
         """
         Fetch energy data from the specified OpenHAB item URL within the given time range.
+        Returns None if the request failed.
         """
         if openhab_item == "":
             return {"data": []}
@@ -129,12 +144,12 @@ class LoadInterface:
             logger.error(
                 "[LOAD-IF] OPENHAB - Request timed out while fetching energy data."
             )
-            return {"data": []}
+            return None
         except requests.exceptions.RequestException as e:
             logger.error(
                 "[LOAD-IF] OPENHAB - Request failed while fetching energy data: %s", e
             )
-            return {"data": []}
+            return None
 
     def __fetch_historical_energy_data_from_homeassistant(
         self, entity_id, start_time, end_time
@@ -148,7 +163,8 @@ class LoadInterface:
             end_time (datetime): The end time for the historical data.
 
         Returns:
-            list: A list of historical state changes for the entity.
+            list: A list of historical state changes for the entity
+            (None if the request failed).
         """
         if entity_id == "" or entity_id is None:
             # logger.debug("[LOAD-IF] HOMEASSISTANT get historical values"+
@@ -186,14 +202,14 @@ class LoadInterface:
                 response.status_code,
             )
             logger.error(response.text)
-            return []
+            return None
         except requests.exceptions.Timeout:
             logger.error(
                 "[LOAD-IF] HOMEASSISTANT - Request timed out"
                 + " while fetching historical energy data for '%s'.",
                 entity_id,
             )
-            return []
+            return None
         except requests.exceptions.RequestException as e:
             logger.error(
                 "[LOAD-IF] HOMEASSISTANT - Request failed while fetching"
@@ -201,7 +217,7 @@ class LoadInterface:
                 entity_id,
                 e,
             )
-            return []
+            return None
 
     def __process_energy_data(self, data, debug_sensor=None):
         """
@@ -453,6 +469,7 @@ class LoadInterface:
         Returns:
             list[dict]: A list of dictionaries containing the processed additional load data.
                         Each dictionary includes a "state" key with the adjusted load value.
+                        None if the data could not be fetched.
         Raises:
             ValueError: If a data entry's "state" value cannot be converted to a float.
             KeyError: If a data entry does not contain the "state" key.
@@ -478,6 +495,8 @@ class LoadInterface:
                 self.src,
             )
             return []
+        if additional_load_data is None:
+            return None
 
         # multiply every value with car_load_unit_factor before returning
         for data_entry in additional_load_data:
@@ -504,6 +523,7 @@ class LoadInterface:
         Returns:
             list[dict]: A list of dictionaries containing the processed car load data.
                         Each dictionary includes a "state" key with the adjusted load value.
+                        None if the data could not be fetched.
         Raises:
             ValueError: If a data entry's "state" value cannot be converted to a float.
             KeyError: If a data entry does not contain the "state" key.
@@ -527,6 +547,8 @@ class LoadInterface:
                 self.src,
             )
             return []
+        if car_load_data is None:
+            return None
 
         # multiply every value with car_load_unit_factor before returning
         for data_entry in car_load_data:
@@ -552,11 +574,23 @@ class LoadInterface:
         Returns:
             list: A list of energy consumption values for the specified day.
         """
+        return self.__create_load_profile_for_day(start_time, end_time)[0]
+
+    def __create_load_profile_for_day(self, start_time, end_time):
+        """
+        Creates the load profile for a specific day from the configured history source.
+
+        Returns:
+            tuple: The list of energy consumption values for the specified day and
+            whether all history requests for it succeeded.
+        """
         logger.debug(
             "[LOAD-IF] Creating day load profile from %s to %s", start_time, end_time
         )
 
         load_profile = []
+        # failed requests count as zero energy - such a profile is not complete
+        complete = True
         current_hour = start_time
 
         while current_hour < end_time:
@@ -575,7 +609,8 @@ class LoadInterface:
                     "[LOAD-IF] Load source '%s' currently not supported. Using default.",
                     self.src,
                 )
-                return []
+                return [], False
+            complete = complete and energy_data is not None
 
             car_load_energy = 0
             # check if car load sensor is configured
@@ -583,9 +618,10 @@ class LoadInterface:
                 car_load_data = self.__get_additional_load_list_from_to(
                     self.car_charge_load_sensor, current_hour, next_hour
                 )
+                complete = complete and car_load_data is not None
                 car_load_energy = abs(
                     self.__process_energy_data(
-                        {"data": car_load_data}, self.car_charge_load_sensor
+                        {"data": car_load_data or []}, self.car_charge_load_sensor
                     )
                 )
             car_load_energy = max(car_load_energy, 0)  # prevent negative values
@@ -596,9 +632,11 @@ class LoadInterface:
                 add_load_data_1 = self.__get_additional_load_list_from_to(
                     self.additional_load_1_sensor, current_hour, next_hour
                 )
+                complete = complete and add_load_data_1 is not None
                 add_load_data_1_energy = abs(
                     self.__process_energy_data(
-                        {"data": add_load_data_1}, self.additional_load_1_sensor
+                        {"data": add_load_data_1 or []},
+                        self.additional_load_1_sensor,
                     )
                 )
             add_load_data_1_energy = max(
@@ -607,7 +645,9 @@ class LoadInterface:
 
             sum_controlable_energy_load = car_load_energy + add_load_data_1_energy
             energy = abs(
-                self.__process_energy_data({"data": energy_data}, self.load_sensor)
+                self.__process_energy_data(
+                    {"data": energy_data or []}, self.load_sensor
+                )
             )
 
             if sum_controlable_energy_load <= energy:
@@ -648,9 +688,7 @@ class LoadInterface:
                 # current_hour += timedelta(hours=1)
                 # continue
 
-            energy_sum = energy
-
-            load_profile.append(energy_sum)
+            load_profile.append(energy)
             logger.debug(
                 "[LOAD-IF] Energy for %s: %5.1f Wh (sum add energy %5.1f Wh - car load: %5.1f Wh)",
                 current_hour,
@@ -665,7 +703,7 @@ class LoadInterface:
                 start_time,
                 end_time,
             )
-        return load_profile
+        return load_profile, complete
 
     def __create_load_profile_weekdays(self):
         """
@@ -685,6 +723,12 @@ class LoadInterface:
         else:
             now = datetime.now(self.time_zone)
 
+        if self._load_profile_cache is not None:
+            cached_day, cached_profile = self._load_profile_cache
+            if cached_day == now.date():
+                logger.debug("[LOAD-IF] Using cached load profile of %s", cached_day)
+                return list(cached_profile)
+
         day_one_week_before = now.replace(
             hour=0, minute=0, second=0, microsecond=0
         ) - timedelta(days=7)
@@ -706,44 +750,55 @@ class LoadInterface:
             day_tomorrow_one_week_before.strftime("%A"),
         )
 
-        # get load profile for day one week before
-        load_profile_one_week_before = self.get_load_profile_for_day(
-            day_one_week_before, day_one_week_before + timedelta(days=1)
-        )
-        # get load profile for day two week before
-        load_profile_two_week_before = self.get_load_profile_for_day(
-            day_two_week_before, day_two_week_before + timedelta(days=1)
-        )
-        # get load profile for day tomorrow one week before
-        load_profile_tomorrow_one_week_before = self.get_load_profile_for_day(
-            day_tomorrow_one_week_before,
-            day_tomorrow_one_week_before + timedelta(days=1),
-        )
-        # get load profile for day tomorrow two week before
-        load_profile_tomorrow_two_week_before = self.get_load_profile_for_day(
-            day_tomorrow_two_week_before,
-            day_tomorrow_two_week_before + timedelta(days=1),
+        results = self.__create_load_profiles_for_days(
+            [
+                day_one_week_before,
+                day_two_week_before,
+                day_tomorrow_one_week_before,
+                day_tomorrow_two_week_before,
+            ]
         )
         # combine load profiles with average of the connected days and
         # combine to a list with 48 values
-        load_profile = []
-        for i, value in enumerate(load_profile_one_week_before):
-            if load_profile_two_week_before and len(load_profile_two_week_before) >= 24:
-                load_profile.append((value + load_profile_two_week_before[i]) / 2)
-            else:
-                load_profile.append(value)
-        for i, value in enumerate(load_profile_tomorrow_one_week_before):
-            if (
-                load_profile_tomorrow_two_week_before
-                and len(load_profile_tomorrow_two_week_before) >= 24
-            ):
-                load_profile.append(
-                    (value + load_profile_tomorrow_two_week_before[i]) / 2
-                )
-            else:
-                load_profile.append(value)
+        load_profile = self.__average_load_profiles(
+            results[0][0], results[1][0]
+        ) + self.__average_load_profiles(results[2][0], results[3][0])
+        # only reuse the profile if every history request succeeded - otherwise
+        # try again with the next run
+        if all(complete for _, complete in results) and len(load_profile) >= 48:
+            self._load_profile_cache = (now.date(), list(load_profile))
         return load_profile
 
+    def __create_load_profiles_for_days(self, days):
+        """
+        Creates the load profiles of the given days - the days are independent, so
+        their history is fetched in parallel.
+
+        Returns:
+            list: (load profile, complete) of every day in the given order.
+        """
+        return list(
+            self._load_profile_pool.map(
+                lambda day: self.__create_load_profile_for_day(
+                    day, day + timedelta(days=1)
+                ),
+                days,
+            )
+        )
+
+    @staticmethod
+    def __average_load_profiles(load_profile, load_profile_week_before):
+        """
+        Averages a day load profile with the one of the week before - if that one
+        is not complete, the load profile is used as is.
+        """
+        if load_profile_week_before and len(load_profile_week_before) >= 24:
+            return [
+                (value + load_profile_week_before[i]) / 2
+                for i, value in enumerate(load_profile)
+            ]
+        return list(load_profile)
+
     def get_load_profile(self, tgt_duration, start_time=None):
         """
         Retrieves the load profile based on the configured source.
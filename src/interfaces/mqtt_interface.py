@@ -471,9 +471,12 @@ class MqttInterface:
         """
         Callback for when a message is received on a subscribed topic.
         """
-        logger.debug(
-            "[MQTT] Received message on topic '%s': %s", msg.topic, msg.payload.decode()
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "[MQTT] Received message on topic '%s': %s",
+                msg.topic,
+                msg.payload.decode(),
+            )
         topic = msg.topic.replace(self.base_topic + "/", "", 1).removesuffix("/set")
         if topic in self.topics_publish:
             try:
@@ -744,15 +747,16 @@ class MqttInterface:
                 "configuration_url": "https://github.com/ohAnd/EOS_connect",
             }
             payload["device"] = device
-            logger.debug(
-                "[MQTT] Sending HA AD config message for %s",
-                self.auto_discover_topic
-                + "/"
-                + item_type
-                + "/"
-                + unique_id
-                + "/config",
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "[MQTT] Sending HA AD config message for %s",
+                    self.auto_discover_topic
+                    + "/"
+                    + item_type
+                    + "/"
+                    + unique_id
+                    + "/config",
+                )
             self.client.publish(
                 self.auto_discover_topic
                 + "/"
@@ -9,10 +9,14 @@ import os
 import subprocess
 from contextlib import closing
 import psutil
+from gevent.pool import Pool
 from gevent.pywsgi import WSGIServer
 
 logger = logging.getLogger(__name__)
 
+# max. number of requests served concurrently by the web server
+WEB_SERVER_POOL_SIZE = 100
+
 
 class PortInterface:
     """
@@ -258,11 +262,14 @@ class PortInterface:
             logger_instance.info(
                 f"[PortInterface] Creating web server on {host}:{desired_port}"
             )
+            # every request is handled in its own greenlet - the pool bounds the
+            # number of concurrently served dashboard requests
             http_server = WSGIServer(
                 (host, desired_port),
                 app,
                 log=None,
                 error_log=logger_instance,
+                spawn=Pool(WEB_SERVER_POOL_SIZE),
             )
 
             # Additional test binding (skip in HA add-on to avoid double binding issues)
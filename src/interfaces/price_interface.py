@@ -22,17 +22,25 @@ Usage:
         "negative_price_switch": True,
         "fixed_24h_array": [10.0] * 24
     }
-    price_interface = PriceInterface(config, timezone="Europe/Berlin")
-    price_interface.update_prices(tgt_duration=24, start_time=datetime.now())
+    price_interface = PriceInterface(config, timezone="Europe/Berlin", tgt_duration=48)
+    # prices are updated in the background - wait for the first update
+    price_interface.wait_for_first_update(timeout=30)
     current_prices = price_interface.get_current_prices()
     current_feedin_prices = price_interface.get_current_feedin_prices()
+    price_interface.shutdown()
 """
 
 from datetime import datetime, timedelta
 from collections import defaultdict
-import json
+from itertools import cycle, islice
 import logging
+import threading
+import time
+import orjson
+import pytz
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger("__main__")
 logger.info("[PRICE-IF] loading module ")
@@ -40,6 +48,19 @@ logger.info("[PRICE-IF] loading module ")
 AKKUDOKTOR_API_PRICES = "https://api.akkudoktor.net/prices"
 TIBBER_API = "https://api.tibber.com/v1-beta/gql"
 SMARTENERGY_API = "https://apis.smartenergy.at/market/v1/price"
+# prices of the next day are published around noon - as long as they are missing,
+# a cached response is only reused for this time (in seconds)
+PRICE_CACHE_INCOMPLETE_TTL = 15 * 60
+
+
+def roll_prices(prices, start_hour, tgt_duration):
+    """
+    Returns tgt_duration prices starting at start_hour. If the prices run out, the
+    missing hours are filled from the beginning of the list (prices of the next day
+    are not yet known - repeat the first day).
+    """
+    # index (start_hour + i) % len(prices) - wraps around without any length checks
+    return list(islice(cycle(prices), start_hour, start_hour + tgt_duration))
 
 
 class PriceInterface:
@@ -54,13 +75,18 @@ class PriceInterface:
         fixed_24h_array (list): Optional fixed 24-hour price array.
         feed_in_tariff_price (float): Feed-in tariff price in cents per kWh.
         negative_price_switch (bool): If True, sets feed-in prices to 0 for negative prices.
-        time_zone (str): Timezone for date and time operations.
+        time_zone (tzinfo): Timezone for date and time operations.
+        tgt_duration (int): Number of hours the background update retrieves prices for.
         current_prices (list): Current prices including taxes.
         current_prices_direct (list): Current prices without tax.
         current_feedin (list): Current feed-in prices.
         default_prices (list): Default price list if external data is unavailable.
 
     Methods:
+        shutdown():
+            Stops the background thread that periodically updates the prices.
+        wait_for_first_update(timeout=None):
+            Blocks until the first background price update is done.
         update_prices(tgt_duration, start_time):
             Updates current_prices and current_feedin for the given duration and start time.
         get_current_prices():
@@ -85,6 +111,7 @@ class PriceInterface:
         self,
         config,
         timezone="UTC",
+        tgt_duration=48,
     ):
         self.src = config["source"]
         self.access_token = config.get("token", "")
@@ -98,11 +125,27 @@ class PriceInterface:
             self.fixed_24h_array = False
         self.feed_in_tariff_price = config.get("feed_in_price", 0.0)
         self.negative_price_switch = config.get("negative_price_switch", False)
-        self.time_zone = timezone
+        self.time_zone = (
+            pytz.timezone(timezone) if isinstance(timezone, str) else timezone
+        )
+        self.tgt_duration = tgt_duration
         self.current_prices = []
         self.current_prices_direct = []  # without tax
         self.current_feedin = []
         self.default_prices = [0.0001] * 48  # if external data are not available
+        # (source, date) -> (expiry as time.monotonic() value or None, parsed prices)
+        self._price_cache = {}
+        # one session for all requests - keeps the connections to the APIs alive
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=2, read=0, backoff_factor=0.3, status_forcelist=(502, 503, 504)
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
         self.__check_config()  # Validate configuration parameters
         logger.info(
@@ -113,6 +156,12 @@ class PriceInterface:
             self.negative_price_switch,
         )
 
+        self._update_thread = None
+        self._stop_event = threading.Event()
+        self._first_update_done = threading.Event()
+        self.update_interval = 15 * 60  # Update every 15 minutes (in seconds)
+        self.__start_update_service()  # Start the background thread for periodic updates
+
     def __check_config(self):
         """
         Checks the configuration for required parameters.
@@ -135,6 +184,61 @@ class PriceInterface:
                 + " Usiung default price source."
             )
 
+    def __start_update_service(self):
+        """
+        Starts the background thread to periodically update the prices.
+        """
+        if self._update_thread is None or not self._update_thread.is_alive():
+            self._stop_event.clear()
+            self._update_thread = threading.Thread(
+                target=self.__update_prices_loop, daemon=True
+            )
+            self._update_thread.start()
+            logger.info("[PRICE-IF] Update service started.")
+
+    def shutdown(self):
+        """
+        Stops the background thread and shuts down the update service.
+        """
+        if self._update_thread and self._update_thread.is_alive():
+            self._stop_event.set()
+            self._update_thread.join()
+            logger.info("[PRICE-IF] Update service stopped.")
+
+    def wait_for_first_update(self, timeout=None):
+        """
+        Blocks until the background thread finished its first price update or the
+        timeout (in seconds) elapsed. Returns True if the update is done.
+        """
+        return self._first_update_done.wait(timeout)
+
+    def __update_prices_loop(self):
+        """
+        The loop that runs in the background thread to update the prices. The prices
+        always start at midnight of the current day - so the loop wakes up right after
+        midnight at the latest.
+        """
+        while not self._stop_event.is_set():
+            now = datetime.now(self.time_zone)
+            start_time = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            try:
+                self.update_prices(self.tgt_duration, start_time)
+            # any error must not end the thread - the prices would never be updated
+            # again, so log it and try again with the next update
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error("[PRICE-IF] Error while updating prices: %s", e)
+            finally:
+                self._first_update_done.set()
+            seconds_to_midnight = (
+                (start_time + timedelta(days=1)).replace(tzinfo=None)
+                - now.replace(tzinfo=None)
+            ).total_seconds()
+            # wait for the next update - returns immediately if the stop event is set
+            if self._stop_event.wait(
+                min(self.update_interval, int(seconds_to_midnight) + 1)
+            ):
+                return
+
     def update_prices(self, tgt_duration, start_time):
         """
         Updates the current prices and feed-in prices based on the target duration
@@ -196,20 +300,17 @@ class PriceInterface:
         Returns:
             list: A list of feed-in prices.
         """
+        feedin_price = round(self.feed_in_tariff_price / 1000, 9)
         if self.negative_price_switch:
             self.current_feedin = [
-                0 if price < 0 else round(self.feed_in_tariff_price / 1000, 9)
-                for price in self.current_prices_direct
+                0 if price < 0 else feedin_price for price in self.current_prices_direct
             ]
             logger.debug(
                 "[PRICE-IF] Negative price switch is enabled."
                 + " Feed-in prices set to 0 for negative prices."
             )
         else:
-            self.current_feedin = [
-                round(self.feed_in_tariff_price / 1000, 9)
-                for _ in self.current_prices_direct
-            ]
+            self.current_feedin = [feedin_price] * len(self.current_prices_direct)
             logger.debug(
                 "[PRICE-IF] Feed-in prices created based on current"
                 + " prices and feed-in tariff price."
@@ -262,6 +363,36 @@ class PriceInterface:
 
         return prices
 
+    def __get_cached_prices(self, cache_key):
+        """
+        Returns the cached prices for the given (source, date) key or None if there are
+        no valid cached prices.
+        """
+        entry = self._price_cache.get(cache_key)
+        if entry is None:
+            return None
+        expiry, prices = entry
+        if expiry is not None and time.monotonic() > expiry:
+            del self._price_cache[cache_key]
+            return None
+        logger.debug("[PRICE-IF] Using cached prices for %s", cache_key)
+        return prices
+
+    def __cache_prices(self, cache_key, prices, complete):
+        """
+        Caches the parsed prices for the given (source, date) key. Complete data (today
+        and tomorrow) is valid for the whole day, otherwise only for a short time to
+        pick up the prices of the next day as soon as they are published.
+        """
+        # entries of other days are outdated
+        self._price_cache = {
+            key: value
+            for key, value in self._price_cache.items()
+            if key[1] == cache_key[1]
+        }
+        expiry = None if complete else time.monotonic() + PRICE_CACHE_INCOMPLETE_TTL
+        self._price_cache[cache_key] = (expiry, prices)
+
     def __retrieve_prices_from_akkudoktor(self, tgt_duration, start_time=None):
         """
         Fetches and processes electricity prices for today and tomorrow.
@@ -291,52 +422,49 @@ class PriceInterface:
                 minute=0, second=0, microsecond=0
             )
         current_hour = start_time.hour
-        request_url = (
-            AKKUDOKTOR_API_PRICES
-            + "?start="
-            + start_time.strftime("%Y-%m-%d")
-            + "&end="
-            + (start_time + timedelta(days=1)).strftime("%Y-%m-%d")
-        )
-        logger.debug("[PRICE-IF] Requesting prices from akkudoktor: %s", request_url)
-        try:
-            response = requests.get(request_url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-        except requests.exceptions.Timeout:
-            logger.error(
-                "[PRICE-IF] Request timed out while fetching prices from akkudoktor."
-                + " Default prices will be used."
-            )
-            self.current_prices_direct = self.default_prices.copy()
-            return self.default_prices
-        except requests.exceptions.RequestException as e:
-            logger.error(
-                "[PRICE-IF] Request failed while fetching prices from akkudoktor: %s"
-                + " Default prices will be used.",
-                e,
+        cache_key = ("akkudoktor", start_time.strftime("%Y-%m-%d"))
+        prices = self.__get_cached_prices(cache_key)
+        if prices is None:
+            request_url = (
+                AKKUDOKTOR_API_PRICES
+                + "?start="
+                + start_time.strftime("%Y-%m-%d")
+                + "&end="
+                + (start_time + timedelta(days=1)).strftime("%Y-%m-%d")
             )
-            self.current_prices_direct = self.default_prices.copy()
-            return self.default_prices
-
-        prices = []
-        for price in data["values"]:
-            prices.append(round(price["marketpriceEurocentPerKWh"] / 100000, 9))
-            # logger.debug(
-            #     "[Main] day 1 - price for %s -> %s", price["marketpriceEurocentPerKWh"],
-            #       price["start"]
-            # )
-
-        if start_time is None:
-            start_time = datetime.now(self.time_zone).replace(
-                minute=0, second=0, microsecond=0
+            logger.debug(
+                "[PRICE-IF] Requesting prices from akkudoktor: %s", request_url
             )
-        current_hour = start_time.hour
-        extended_prices = prices[current_hour : current_hour + tgt_duration]
+            try:
+                response = self.session.get(request_url, timeout=10)
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+            except requests.exceptions.Timeout:
+                logger.error(
+                    "[PRICE-IF] Request timed out while fetching prices from akkudoktor."
+                    + " Default prices will be used."
+                )
+                self.current_prices_direct = self.default_prices.copy()
+                return self.default_prices
+            except (
+                requests.exceptions.RequestException,
+                orjson.JSONDecodeError,
+            ) as e:
+                logger.error(
+                    "[PRICE-IF] Request failed while fetching prices from akkudoktor: %s"
+                    + " Default prices will be used.",
+                    e,
+                )
+                self.current_prices_direct = self.default_prices.copy()
+                return self.default_prices
+
+            prices = [
+                round(price["marketpriceEurocentPerKWh"] / 100000, 9)
+                for price in data["values"]
+            ]
+            self.__cache_prices(cache_key, prices, complete=len(prices) >= 48)
 
-        if len(extended_prices) < tgt_duration:
-            remaining_hours = tgt_duration - len(extended_prices)
-            extended_prices.extend(prices[:remaining_hours])
+        extended_prices = roll_prices(prices, current_hour, tgt_duration)
         logger.debug("[PRICE-IF] Prices from AKKUDOKTOR fetched successfully.")
         self.current_prices_direct = extended_prices.copy()
         return extended_prices
@@ -364,109 +492,99 @@ class PriceInterface:
                 "[PRICE-IF] Price source '%s' currently not supported.", self.src
             )
             return self.default_prices
-        headers = {
-            "Authorization": self.access_token,
-            "Content-Type": "application/json",
-        }
-        query = """
-        {
-            viewer {
-                homes {
-                    currentSubscription {
-                        priceInfo {
-                            today {
-                                total
-                                energy
-                                startsAt
-                            }
-                            tomorrow {
-                                total
-                                energy
-                                startsAt
+        if start_time is None:
+            start_time = datetime.now(self.time_zone).replace(
+                minute=0, second=0, microsecond=0
+            )
+        cache_key = ("tibber", start_time.strftime("%Y-%m-%d"))
+        cached = self.__get_cached_prices(cache_key)
+        if cached is not None:
+            prices, prices_direct = cached
+        else:
+            headers = {
+                "Authorization": self.access_token,
+                "Content-Type": "application/json",
+            }
+            query = """
+            {
+                viewer {
+                    homes {
+                        currentSubscription {
+                            priceInfo {
+                                today {
+                                    total
+                                    energy
+                                    startsAt
+                                }
+                                tomorrow {
+                                    total
+                                    energy
+                                    startsAt
+                                }
                             }
                         }
                     }
                 }
             }
-        }
-        """
-        try:
-            response = requests.post(
-                TIBBER_API, headers=headers, json={"query": query}, timeout=10
-            )
-            response.raise_for_status()
-        except requests.exceptions.Timeout:
-            logger.error(
-                "[PRICE-IF] Request timed out while fetching prices from Tibber."
-                + " Default prices will be used."
-            )
-            return self.default_prices
-        except requests.exceptions.RequestException as e:
-            logger.error(
-                "[PRICE-IF] Request failed while fetching prices from Tibber: %s"
-                + " Default prices will be used.",
-                e,
-            )
-            return self.default_prices
-
-        response.raise_for_status()
-        data = response.json()
-        if "errors" in data and data["errors"] is not None:
-            logger.error(
-                "[PRICE-IF] Error fetching prices - tibber API response: %s",
-                data["errors"][0]["message"],
-            )
-            return []
-
-        today_prices = json.dumps(
-            data["data"]["viewer"]["homes"][0]["currentSubscription"]["priceInfo"][
-                "today"
+            """
+            try:
+                response = self.session.post(
+                    TIBBER_API, headers=headers, json={"query": query}, timeout=10
+                )
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+            except requests.exceptions.Timeout:
+                logger.error(
+                    "[PRICE-IF] Request timed out while fetching prices from Tibber."
+                    + " Default prices will be used."
+                )
+                return self.default_prices
+            except (
+                requests.exceptions.RequestException,
+                orjson.JSONDecodeError,
+            ) as e:
+                logger.error(
+                    "[PRICE-IF] Request failed while fetching prices from Tibber: %s"
+                    + " Default prices will be used.",
+                    e,
+                )
+                return self.default_prices
+
+            if "errors" in data and data["errors"] is not None:
+                logger.error(
+                    "[PRICE-IF] Error fetching prices - tibber API response: %s",
+                    data["errors"][0]["message"],
+                )
+                return []
+
+            price_info = data["data"]["viewer"]["homes"][0]["currentSubscription"][
+                "priceInfo"
             ]
-        )
-        tomorrow_prices = json.dumps(
-            data["data"]["viewer"]["homes"][0]["currentSubscription"]["priceInfo"][
-                "tomorrow"
+            today_prices_json = price_info["today"]
+            tomorrow_prices_json = price_info["tomorrow"]
+            prices = [round(price["total"] / 1000, 9) for price in today_prices_json]
+            prices_direct = [
+                round(price["energy"] / 1000, 9) for price in today_prices_json
             ]
-        )
-
-        today_prices_json = json.loads(today_prices)
-        tomorrow_prices_json = json.loads(tomorrow_prices)
-        prices = []
-        prices_direct = []
-
-        for price in today_prices_json:
-            prices.append(round(price["total"] / 1000, 9))
-            prices_direct.append(round(price["energy"] / 1000, 9))
-            # logger.debug(
-            #     "[Main] day 1 - price for %s -> %s", price["startsAt"], price["total"]
-            # )
-        if tomorrow_prices_json:
-            for price in tomorrow_prices_json:
-                prices.append(round(price["total"] / 1000, 9))
-                prices_direct.append(round(price["energy"] / 1000, 9))
-                # logger.debug(
-                #     "[Main] day 2 - price for %s -> %s", price["startsAt"], price["total"]
-                # )
-        else:
-            prices.extend(prices[:24])  # Repeat today's prices for tomorrow
-            prices_direct.extend(
-                prices_direct[:24]
-            )  # Repeat today's prices for tomorrow
-
-        if start_time is None:
-            start_time = datetime.now(self.time_zone).replace(
-                minute=0, second=0, microsecond=0
+            if tomorrow_prices_json:
+                prices.extend(
+                    round(price["total"] / 1000, 9) for price in tomorrow_prices_json
+                )
+                prices_direct.extend(
+                    round(price["energy"] / 1000, 9) for price in tomorrow_prices_json
+                )
+            else:
+                prices.extend(prices[:24])  # Repeat today's prices for tomorrow
+                prices_direct.extend(
+                    prices_direct[:24]
+                )  # Repeat today's prices for tomorrow
+            self.__cache_prices(
+                cache_key, (prices, prices_direct), complete=bool(tomorrow_prices_json)
             )
-        current_hour = start_time.hour
-        extended_prices = prices[current_hour : current_hour + tgt_duration]
-        extended_prices_direct = prices_direct[
-            current_hour : current_hour + tgt_duration
-        ]
 
-        if len(extended_prices) < tgt_duration:
-            remaining_hours = tgt_duration - len(extended_prices)
-            extended_prices.extend(prices[:remaining_hours])
-            extended_prices_direct.extend(prices_direct[:remaining_hours])
+        current_hour = start_time.hour
+        extended_prices = roll_prices(prices, current_hour, tgt_duration)
+        extended_prices_direct = roll_prices(prices_direct, current_hour, tgt_duration)
         self.current_prices_direct = extended_prices_direct.copy()
         logger.debug("[PRICE-IF] Prices from TIBBER fetched successfully.")
         return extended_prices
@@ -489,16 +607,19 @@ class PriceInterface:
             "[PRICE-IF] Requesting prices from SMARTENERGY_AT: %s", request_url
         )
         try:
-            response = requests.get(request_url, timeout=10)
+            response = self.session.get(request_url, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
         except requests.exceptions.Timeout:
             logger.error(
                 "[PRICE-IF] Request timed out while fetching prices from SMARTENERGY_AT."
                 + " Default prices will be used."
             )
             return self.default_prices
-        except requests.exceptions.RequestException as e:
+        except (
+            requests.exceptions.RequestException,
+            orjson.JSONDecodeError,
+        ) as e:
             logger.error(
                 "[PRICE-IF] Request failed while fetching prices from SMARTENERGY_AT: %s"
                 + " Default prices will be used.",
@@ -513,11 +634,10 @@ class PriceInterface:
             hour = datetime.fromisoformat(entry["date"]).hour
             hourly[hour].append(entry["value"] / 100000)  # Convert to euro/wh
         # Compute the average for each hour (0-23)
-        hourly_prices = []
-        for hour in range(24):
-            values = hourly.get(hour, [])
-            avg = sum(values) / len(values) if values else 0
-            hourly_prices.append(round(avg, 6))
+        hourly_prices = [
+            round(sum(hourly[hour]) / len(hourly[hour]), 6) if hourly.get(hour) else 0
+            for hour in range(24)
+        ]
 
         # Optionally extend to tgt_duration if needed
         extended_prices = hourly_prices
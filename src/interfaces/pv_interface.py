@@ -24,12 +24,17 @@ Logging:
 
 from datetime import datetime, timedelta
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import time
+from urllib.parse import urlencode
 import asyncio
 import aiohttp
 import pytz
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pvlib
 import pandas as pd
 import numpy as np
@@ -39,6 +44,36 @@ logger = logging.getLogger("__main__")
 logger.info("[PV-IF] loading module ")
 
 EOS_API_GET_PV_FORECAST = "https://api.akkudoktor.net/forecast"
+# a forecast response is reused for this time (in seconds) - well below the update
+# interval, so every update cycle still fetches a fresh forecast
+PV_FORECAST_CACHE_TTL = 5 * 60
+
+
+def parse_iso_times_to_local_times(timestrs, time_zone):
+    """
+    Parses a list of ISO 8601 time strings at once and converts them to the given
+    timezone - naive times are taken as local times of that timezone. Returns a pandas
+    Series of tz aware time stamps in the order of the given strings.
+    """
+    timestrs = pd.Series(timestrs, dtype=object)
+    aware = timestrs.str.contains(r"(?:[zZ]|[+-]\d{2}:?\d{2})$", na=False)
+    if aware.any() and not aware.all():
+        # mixed input - parse the naive and the aware times separately
+        return pd.concat(
+            [
+                parse_iso_times_to_local_times(timestrs[aware], time_zone),
+                parse_iso_times_to_local_times(timestrs[~aware], time_zone),
+            ]
+        ).sort_index()
+    if len(timestrs) and not aware.iloc[0]:
+        # If datetime is naive, localize it (standard time for ambiguous times)
+        return pd.to_datetime(timestrs, format="ISO8601").dt.tz_localize(
+            time_zone,
+            ambiguous=np.zeros(len(timestrs), dtype=bool),
+            nonexistent="shift_forward",
+        )
+    # Convert to configured timezone
+    return pd.to_datetime(timestrs, format="ISO8601", utc=True).dt.tz_convert(time_zone)
 
 
 class PvInterface:
@@ -56,6 +91,7 @@ class PvInterface:
     ):
         self.config = config
         self.time_zone = timezone
+        self.tz = pytz.timezone(timezone)  # resolved once, used for all conversions
         self.config_source = config_source
         self.config_special = config_special
         logger.debug(
@@ -75,10 +111,35 @@ class PvInterface:
             "config_entry": None,
             "source": None,
         }
+        # error state of the forecast request running in the current thread - the
+        # entries are requested concurrently and must not overwrite each other
+        self._request_error = threading.local()
         self.temp_forecast_array = [15] * 48
+        self._forecast_pool = ThreadPoolExecutor(
+            max_workers=min(8, max(1, len(self.config))),
+            thread_name_prefix="pv_forecast",
+        )
+        # raw horizon setting -> normalized 36 values, parsed once per distinct setting
+        self._horizon_cache = {}
+        # url parameter values of a pv config entry -> akkudoktor forecast url
+        self._forecast_urls = {}
+        # akkudoktor forecast url -> (expiry as time.monotonic() value, forecast values)
+        self._akkudoktor_cache = {}
+        # one session for all requests - keeps the connections to the APIs alive
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=2, read=0, backoff_factor=0.3, status_forcelist=(502, 503, 504)
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
         self._update_thread = None
         self._stop_event = threading.Event()
+        self._first_update_done = threading.Event()
         self.update_interval = 15 * 60  # Update 15 minutes (in seconds)
         logger.info("[PV-IF] Initialized")
         self.__start_update_service()  # Start the background thread for periodic updates
@@ -149,6 +210,14 @@ class PvInterface:
             self._stop_event.set()
             self._update_thread.join()
             logger.info("[PV-IF] Update service stopped.")
+        self._forecast_pool.shutdown(wait=False, cancel_futures=True)
+
+    def wait_for_first_update(self, timeout=None):
+        """
+        Blocks until the background thread finished its first PV and temperature update
+        or the timeout (in seconds) elapsed. Returns True if the update is done.
+        """
+        return self._first_update_done.wait(timeout)
 
     def __update_pv_state_loop(self):
         """
@@ -183,13 +252,10 @@ class PvInterface:
             else:
                 self.temp_forecast_array = self.__get_default_temperature_forecast()
             logger.info("[PV-IF] PV and Temperature updated")
-            # Break the sleep interval into smaller chunks to allow immediate shutdown
-            sleep_interval = self.update_interval
-            while sleep_interval > 0:
-                if self._stop_event.is_set():
-                    return  # Exit immediately if stop event is set
-                time.sleep(min(1, sleep_interval))  # Sleep in 1-second chunks
-                sleep_interval -= 1
+            self._first_update_done.set()
+            # wait for the next update - returns immediately if the stop event is set
+            if self._stop_event.wait(self.update_interval):
+                return
 
         self.__start_update_service()
 
@@ -217,30 +283,26 @@ class PvInterface:
     def __create_forecast_request(self, pv_config_entry):
         """
         Creates a forecast request URL for the EOS server.
-        """
-        horizon_string = ""
+        The URL is built once per distinct set of parameters and reused afterwards.
+        """
+        params = {
+            "lat": pv_config_entry["lat"],
+            "lon": pv_config_entry["lon"],
+            "azimuth": pv_config_entry["azimuth"],
+            "tilt": pv_config_entry["tilt"],
+            "power": pv_config_entry["power"],
+            "powerInverter": pv_config_entry["powerInverter"],
+            "inverterEfficiency": pv_config_entry["inverterEfficiency"],
+            "timezone": self.time_zone,
+        }
         if pv_config_entry["horizon"] != "":
-            horizon_string = "&horizont=" + str(pv_config_entry["horizon"])
-        return (
-            EOS_API_GET_PV_FORECAST
-            + "?lat="
-            + str(pv_config_entry["lat"])
-            + "&lon="
-            + str(pv_config_entry["lon"])
-            + "&azimuth="
-            + str(pv_config_entry["azimuth"])
-            + "&tilt="
-            + str(pv_config_entry["tilt"])
-            + "&power="
-            + str(pv_config_entry["power"])
-            + "&powerInverter="
-            + str(pv_config_entry["powerInverter"])
-            + "&inverterEfficiency="
-            + str(pv_config_entry["inverterEfficiency"])
-            + "&timezone="
-            + str(self.time_zone)
-            + horizon_string
-        )
+            params["horizont"] = pv_config_entry["horizon"]
+        key = tuple(map(str, params.values()))
+        url = self._forecast_urls.get(key)
+        if url is None:
+            url = EOS_API_GET_PV_FORECAST + "?" + urlencode(params, safe=",/")
+            self._forecast_urls[key] = url
+        return url
 
     def __get_default_pv_forcast(self, pv_power):
         """
@@ -336,21 +398,59 @@ class PvInterface:
         forecast_values = []
         if self.config_special and self.config_source.get("source") == "evcc":
             logger.debug("[PV-IF] fetching forecast for evcc config")
-            forecast = self.get_pv_forecast("evcc_config", tgt_duration)
-            forecast_values = forecast
+            forecast_values, error = self.__get_pv_forecast_and_error(
+                "evcc_config", tgt_duration
+            )
+            errors = [error] if error is not None else []
         else:
+            # fetch all installations concurrently - the requests are I/O bound
+            futures = []
             for config_entry in self.config:
                 logger.debug("[PV-IF] fetching forecast for '%s'", config_entry["name"])
-                forecast = self.get_pv_forecast(config_entry, tgt_duration)
-                # print("values for " + config_entry+ " -> ")
-                # print(forecast)
-                if not forecast_values:
-                    forecast_values = forecast
-                else:
-                    forecast_values = [x + y for x, y in zip(forecast_values, forecast)]
+                futures.append(
+                    self._forecast_pool.submit(
+                        self.__get_pv_forecast_and_error, config_entry, tgt_duration
+                    )
+                )
+            results = [future.result() for future in futures]
+            errors = [error for _, error in results if error is not None]
+            forecasts = [forecast for forecast, _ in results if len(forecast) > 0]
+            if forecasts:
+                # sum up all installations - cut to the shortest forecast like zip() did
+                length = min(len(forecast) for forecast in forecasts)
+                forecast_values = (
+                    np.array([forecast[:length] for forecast in forecasts], dtype=float)
+                    .sum(axis=0)
+                    .tolist()
+                )
+        # a failed entry is reported even if other entries succeeded
+        self.pv_forcast_request_error.update(errors[0] if errors else {"error": None})
         logger.debug("[PV-IF] Summarized PV forecast values: %s", forecast_values)
         return forecast_values
 
+    def __get_pv_forecast_and_error(self, config_entry, tgt_duration):
+        """
+        Fetches the forecast of one config entry and returns it together with the
+        error state of its request (None if the request succeeded).
+        """
+        self._request_error.value = None
+        forecast = self.get_pv_forecast(config_entry, tgt_duration)
+        error = self._request_error.value
+        if error is not None:
+            error["config_entry"] = config_entry
+            error["source"] = self.config_source.get("source")
+        return forecast, error
+
+    def __set_request_error(self, error, message):
+        """
+        Records the error of the forecast request running in the current thread.
+        """
+        self._request_error.value = {
+            "error": error,
+            "timestamp": datetime.now().isoformat(),
+            "message": message,
+        }
+
     def __get_pv_forecast_akkudoktor_api(
         self, tgt_value="power", pv_config_entry=None, tgt_duration=24
     ):
@@ -367,24 +467,36 @@ class PvInterface:
         forecast_request_payload = self.__create_forecast_request(pv_config_entry)
         # print(forecast_request_payload)
         recv_error = False
-        try:
-            response = requests.get(forecast_request_payload, timeout=5)
-            response.raise_for_status()
-            day_values = response.json()
-            day_values = day_values["values"]
-        except requests.exceptions.Timeout:
-            logger.error(
-                "[PV-IF][akkudoktor] Request timed out while fetching PV forecast. (%s)",
-                tgt_value,
-            )
-            recv_error = True
-        except requests.exceptions.RequestException as e:
-            logger.error(
-                "[PV-IF][akkudoktor] Request failed while fetching PV forecast (%s): %s",
-                tgt_value,
-                e,
-            )
-            recv_error = True
+        cached = self._akkudoktor_cache.get(forecast_request_payload)
+        if cached is not None and time.monotonic() < cached[0]:
+            # same url was just requested (e.g. power and temperature of one entry)
+            day_values = cached[1]
+        else:
+            try:
+                response = self.session.get(forecast_request_payload, timeout=5)
+                response.raise_for_status()
+                day_values = orjson.loads(response.content)
+                day_values = day_values["values"]
+                self._akkudoktor_cache[forecast_request_payload] = (
+                    time.monotonic() + PV_FORECAST_CACHE_TTL,
+                    day_values,
+                )
+            except requests.exceptions.Timeout:
+                logger.error(
+                    "[PV-IF][akkudoktor] Request timed out while fetching PV forecast. (%s)",
+                    tgt_value,
+                )
+                recv_error = True
+            except (
+                requests.exceptions.RequestException,
+                orjson.JSONDecodeError,
+            ) as e:
+                logger.error(
+                    "[PV-IF][akkudoktor] Request failed while fetching PV forecast (%s): %s",
+                    tgt_value,
+                    e,
+                )
+                recv_error = True
         if recv_error:
             if tgt_value == "power":
                 logger.info(
@@ -402,9 +514,7 @@ class PvInterface:
                 # return a default temperature forecast with 0% at night and 100% at noon
                 return self.__get_default_temperature_forecast()
 
-        forecast_values = []
-        tz = pytz.timezone(self.time_zone)
-        current_time = tz.localize(
+        current_time = self.tz.localize(
             datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
         )
         end_time = current_time + timedelta(hours=tgt_duration)
@@ -416,22 +526,24 @@ class PvInterface:
         #     end_time.isoformat(),
         # )
 
-        for forecast_entry in day_values:
-            for forecast in forecast_entry:
-                entry_time = self.__parse_iso_time_to_local_time(forecast["datetime"])
-
-                if current_time <= entry_time < end_time:
-                    value = forecast.get(tgt_value, 0)
-
-                    # logger.debug(
-                    #     "[PV-IF] Processing forecast entry at %s (%s) for value:  %s",
-                    #     entry_time.isoformat(), forecast["datetime"],
-                    #     value,
-                    # )
-                    # if power is negative, set it to 0 (fixing wrong values form api)
-                    if tgt_value == "power" and value < 0:
-                        value = 0
-                    forecast_values.append(value)
+        # parse all time stamps at once and select the requested time window
+        forecasts = [
+            forecast for forecast_entry in day_values for forecast in forecast_entry
+        ]
+        entry_times = parse_iso_times_to_local_times(
+            [forecast["datetime"] for forecast in forecasts], self.time_zone
+        )
+        in_window = (
+            (entry_times >= pd.Timestamp(current_time))
+            & (entry_times < pd.Timestamp(end_time))
+        ).to_numpy()
+        values = np.array(
+            [forecast.get(tgt_value) or 0 for forecast in forecasts], dtype=float
+        )[in_window]
+        if tgt_value == "power":
+            # if power is negative, set it to 0 (fixing wrong values form api)
+            values = np.maximum(values, 0)
+        forecast_values = values.tolist()
         # workaround for wrong time points in the forecast from akkudoktor
         # remove first entry and append 0 to the end
         forecast_values.pop(0)
@@ -468,7 +580,15 @@ class PvInterface:
             )
         return forecast_values
 
-    def __get_horizon_elevation(self, sun_azimuth, horizon):
+    def __get_normalized_horizon(self, horizon):
+        """
+        Returns the horizon setting as list of 36 elevation values (10° steps).
+        The result is cached per raw setting, so the string is only parsed once.
+        """
+        cache_key = horizon if isinstance(horizon, str) else tuple(horizon or ())
+        normalized = self._horizon_cache.get(cache_key)
+        if normalized is not None:
+            return normalized
 
         if not horizon or len(horizon) == 0:
             horizon = [0] * 36
@@ -492,6 +612,12 @@ class PvInterface:
         #     "[PV-IF] Horizon elevation values normalized to 36 values: %s",
         #     horizon
         # )
+        self._horizon_cache[cache_key] = horizon
+        return horizon
+
+    def __get_horizon_elevation(self, sun_azimuth, horizon):
+
+        horizon = self.__get_normalized_horizon(horizon)
 
         idx = int((sun_azimuth / 10))  # Convert azimuth to index (0-35)
         # logger.debug(
@@ -537,8 +663,8 @@ class PvInterface:
             f"&forecast_days={int(np.ceil(hours/24))}"
             f"&timezone={timezone}"
         )
-        response = requests.get(url, timeout=5)
-        data = response.json()
+        response = self.session.get(url, timeout=5)
+        data = orjson.loads(response.content)
 
         radiation = data["hourly"]["shortwave_radiation"][:hours]  # W/m²
         cloudcover = data["hourly"]["cloudcover"][:hours]  # %
@@ -729,43 +855,28 @@ class PvInterface:
         )
         logger.debug("[PV-IF] Fetching PV forecast from Forecast.Solar API: %s", url)
         try:
-            response = requests.get(url, timeout=5)
+            response = self.session.get(url, timeout=5)
             response.raise_for_status()
-            self.pv_forcast_request_error["error"] = None
         except requests.exceptions.Timeout:
             logger.error("[PV-IF] Forecast.Solar API request timed out.")
-            self.pv_forcast_request_error["error"] = "timeout"
-            self.pv_forcast_request_error["timestamp"] = datetime.now().isoformat()
-            self.pv_forcast_request_error["message"] = (
-                "Forecast.Solar API request timed out."
-            )
-            self.pv_forcast_request_error["config_entry"] = pv_config_entry
-            self.pv_forcast_request_error["source"] = "forecast_solar"
+            self.__set_request_error("timeout", "Forecast.Solar API request timed out.")
             return []
         except requests.exceptions.RequestException as e:
             logger.error("[PV-IF] Forecast.Solar API request failed: %s", e)
             # logger.error("[PV-IF] Forecast.Solar API error response: %s", response.json())
-            self.pv_forcast_request_error["error"] = "request_failed"
-            self.pv_forcast_request_error["timestamp"] = datetime.now().isoformat()
-            self.pv_forcast_request_error["message"] = (
-                f"Forecast.Solar API request failed: {e}"
+            self.__set_request_error(
+                "request_failed", f"Forecast.Solar API request failed: {e}"
             )
-            self.pv_forcast_request_error["config_entry"] = pv_config_entry
-            self.pv_forcast_request_error["source"] = "forecast_solar"
             return []
-        data = response.json()
+        data = orjson.loads(response.content)
         # logger.debug("[PV-IF] Forecast.Solar API response: %s", data)
         watt_hours_period = data.get("result", {}).get("watt_hours_period", {})
 
         if not watt_hours_period:
             logger.error("[PV-IF] No valid watt_hours_period data found.")
-            self.pv_forcast_request_error["error"] = "no_valid_data"
-            self.pv_forcast_request_error["timestamp"] = datetime.now().isoformat()
-            self.pv_forcast_request_error["message"] = (
-                "No valid watt_hours_period data found."
+            self.__set_request_error(
+                "no_valid_data", "No valid watt_hours_period data found."
             )
-            self.pv_forcast_request_error["config_entry"] = pv_config_entry
-            self.pv_forcast_request_error["source"] = "forecast_solar"
             return []
 
         parsed = [
@@ -779,29 +890,11 @@ class PvInterface:
         hours = [midnight + timedelta(hours=i) for i in range(48)]
         # Build a lookup dict for fast access
         lookup = {dt: v for dt, v in parsed}
-        # Fill the forecast array
-        forecast_wh = []
-        for h in hours:
-            # Use value if exact hour exists, else 0
-            forecast_wh.append(lookup.get(h, 0))
-
-        pv_forecast = forecast_wh
+        # Fill the forecast array - use value if exact hour exists, else 0
+        pv_forecast = [lookup.get(h, 0) for h in hours]
         # logger.debug("[PV-IF] Forecast.Solar PV forecast (Wh): %s", pv_forecast)
         return pv_forecast
 
-    def __parse_iso_time_to_local_time(self, timestr):
-        """
-        Parses an ISO 8601 time string and converts it to the configured local timezone.
-        """
-        dt = datetime.fromisoformat(timestr)
-        if dt.tzinfo is None:
-            # If datetime is naive, localize it
-            dt = pytz.timezone(self.time_zone).localize(dt)
-        else:
-            # Convert to configured timezone
-            dt = dt.astimezone(pytz.timezone(self.time_zone))
-        return dt
-
     def __get_pv_forecast_evcc_api(self, pv_config_entry, hours=48):
         """
         Fetches PV forecast from an EVCC instance.
@@ -815,26 +908,17 @@ class PvInterface:
         url = self.config_special.get("url", "").rstrip("/") + "/api/state"
         logger.debug("[PV-IF] Fetching PV forecast from EVCC API: %s", url)
         try:
-            response = requests.get(url, timeout=5)
+            response = self.session.get(url, timeout=5)
             response.raise_for_status()
-            self.pv_forcast_request_error["error"] = None
         except requests.exceptions.Timeout:
             logger.error("[PV-IF] EVCC API request timed out.")
-            self.pv_forcast_request_error["error"] = "timeout"
-            self.pv_forcast_request_error["timestamp"] = datetime.now().isoformat()
-            self.pv_forcast_request_error["message"] = "EVCC API request timed out."
-            self.pv_forcast_request_error["config_entry"] = pv_config_entry
-            self.pv_forcast_request_error["source"] = "evcc"
+            self.__set_request_error("timeout", "EVCC API request timed out.")
             return []
         except requests.exceptions.RequestException as e:
             logger.error("[PV-IF] EVCC API request failed: %s", e)
-            self.pv_forcast_request_error["error"] = "request_failed"
-            self.pv_forcast_request_error["timestamp"] = datetime.now().isoformat()
-            self.pv_forcast_request_error["message"] = f"EVCC API request failed: {e}"
-            self.pv_forcast_request_error["config_entry"] = pv_config_entry
-            self.pv_forcast_request_error["source"] = "evcc"
+            self.__set_request_error("request_failed", f"EVCC API request failed: {e}")
             return []
-        data = response.json()
+        data = orjson.loads(response.content)
         # print("raw evcc api data: %s", data)
         solar_forecast_all = data.get("forecast", []).get("solar", [])
         solar_forecast_scale = solar_forecast_all.get("scale", "unknown")
@@ -852,16 +936,24 @@ class PvInterface:
 
         solar_forecast = solar_forecast_all.get("timeseries", [])
 
-        pv_forecast = [0] * hours
-        day_start = datetime.now(pytz.timezone(self.time_zone))
+        day_start = datetime.now(self.tz)
         day_start = day_start.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_time = day_start + timedelta(hours=hours)
-        for entry in solar_forecast:
-            entry_time = self.__parse_iso_time_to_local_time(entry.get("ts", ""))
-            if day_start <= entry_time < end_time:
-                index = int((entry_time - day_start).total_seconds() / 3600)
-                if 0 <= index < hours:
-                    pv_forecast[index] = entry.get("val", 0) * scale_factor
+        # parse all time stamps at once and map them to hour slots from midnight
+        entry_times = parse_iso_times_to_local_times(
+            [entry.get("ts", "") for entry in solar_forecast], self.time_zone
+        )
+        indices = np.floor(
+            (entry_times - pd.Timestamp(day_start)).dt.total_seconds().to_numpy() / 3600
+        )
+        in_window = (indices >= 0) & (indices < hours)
+        values = np.array(
+            [entry.get("val", 0) for entry in solar_forecast], dtype=np.float64
+        )
+        forecast_values = np.zeros(hours)
+        forecast_values[indices[in_window].astype(int)] = (
+            values[in_window] * scale_factor
+        )
+        pv_forecast = forecast_values.tolist()
 
         logger.debug(
             "[PV-IF] EVCC PV forecast for given evcc pv config (Wh): %s",
@@ -883,8 +975,7 @@ class PvInterface:
 
         # print out to csv file - first column is the hour, second column is the value
         # Set start to today at midnight in the configured timezone
-        tz = pytz.timezone(self.time_zone)
-        start_midnight = datetime.now(tz).replace(
+        start_midnight = datetime.now(self.tz).replace(
             hour=0, minute=0, second=0, microsecond=0
         )
         df = pd.DataFrame(
@@ -0,0 +1,63 @@
+"""
+Tests for the time stamp parsing of the PV forecast interface.
+"""
+
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "interfaces"))
+
+from pv_interface import (  # pylint: disable=wrong-import-position
+    parse_iso_times_to_local_times,
+)
+
+
+def test_parse_naive_times_as_local_times():
+    """
+    Naive times are local times - ambiguous ones are taken as standard time.
+    """
+    times = parse_iso_times_to_local_times(
+        ["2025-01-01T10:00:00", "2025-10-26T02:30:00"], "Europe/Berlin"
+    )
+    assert times.tolist() == [
+        pd.Timestamp("2025-01-01T10:00:00+01:00"),
+        pd.Timestamp("2025-10-26T02:30:00+01:00"),
+    ]
+
+
+def test_parse_aware_times_with_different_offsets():
+    """
+    Aware times are converted to the timezone, also across a DST change.
+    """
+    times = parse_iso_times_to_local_times(
+        ["2025-01-01T09:00:00Z", "2025-06-01T10:00:00+02:00"], "Europe/Berlin"
+    )
+    assert times.tolist() == [
+        pd.Timestamp("2025-01-01T10:00:00+01:00"),
+        pd.Timestamp("2025-06-01T10:00:00+02:00"),
+    ]
+
+
+def test_parse_mixed_naive_and_aware_times():
+    """
+    Mixed input is parsed per kind - the naive times stay local times and the order
+    of the input is kept.
+    """
+    times = parse_iso_times_to_local_times(
+        [
+            "2025-01-01T10:00:00",
+            "2025-01-01T10:00:00Z",
+            "2025-01-01T12:00:00",
+            "2025-01-01T12:00:00+01:00",
+        ],
+        "Europe/Berlin",
+    )
+    assert times.tolist() == [
+        pd.Timestamp("2025-01-01T10:00:00+01:00"),
+        pd.Timestamp("2025-01-01T11:00:00+01:00"),
+        pd.Timestamp("2025-01-01T12:00:00+01:00"),
+        pd.Timestamp("2025-01-01T12:00:00+01:00"),
+    ]
+    assert str(times.dt.tz) == "Europe/Berlin"